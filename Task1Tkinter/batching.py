@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class TranslationBatcher:
+    """Packs many short translation requests into a few list requests.
+
+    Requests for the same language pair are collected for up to `max_delay`
+    seconds, or until `max_items` texts / `max_chars` characters are pending, and
+    then handed to translate_batch(texts, src_lang, dest_lang) in one call. Each
+    caller gets a Future for its own text, so per-request overhead (HTTP round
+    trip, rate-limit token) is paid once per batch instead of once per text.
+    """
+
+    def __init__(self, translate_batch, max_items=50, max_chars=4000, max_delay=0.005, workers=2):
+        self.translate_batch = translate_batch
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self.batches_sent = 0
+        self.items_sent = 0
+        self.__groups = {}  # (src, dest) -> [deadline, chars, [(text, future), ...]]
+        self.__ready = []  # Full or expired groups waiting to be sent
+        self.__condition = threading.Condition()
+        self.__closed = False
+        # Batches run on their own pool so callers blocking on a batch can never starve it
+        self.__executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='batch')
+        self.__thread = threading.Thread(target=self.__collect_loop, name='batcher', daemon=True)
+        self.__thread.start()
+
+    def submit(self, text, src_lang, dest_lang):
+        """Queues a text and returns a Future for its translation."""
+        future = Future()
+        key = (src_lang, dest_lang)
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("Batcher is closed")
+            group = self.__groups.get(key)
+            if group is not None and (len(group[2]) >= self.max_items
+                                      or group[1] + len(text) > self.max_chars):
+                # This text would overflow the group: send what we have now
+                self.__ready.append((key, self.__groups.pop(key)[2]))
+                group = None
+            if group is None:
+                group = [time.monotonic() + self.max_delay, 0, []]
+                self.__groups[key] = group
+            group[1] += len(text)
+            group[2].append((text, future))
+            self.__condition.notify()
+        return future
+
+    def translate(self, text, src_lang, dest_lang):
+        """Queues a text and waits for its translation."""
+        return self.submit(text, src_lang, dest_lang).result()
+
+    def close(self):
+        """Cancels whatever is pending and stops, without waiting for batches in flight."""
+        with self.__condition:
+            self.__closed = True
+            pending = list(self.__ready)
+            pending.extend((key, group[2]) for key, group in self.__groups.items())
+            self.__ready = []
+            self.__groups.clear()
+            self.__condition.notify()
+        for key, items in pending:
+            for text, future in items:
+                future.cancel()
+        self.__thread.join()
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+
+    def __collect_loop(self):
+        """Moves expired groups to the ready list and dispatches them (private method)."""
+        while True:
+            with self.__condition:
+                while True:
+                    now = time.monotonic()
+                    for key in [k for k, g in self.__groups.items()
+                                if self.__closed or g[0] <= now]:
+                        self.__ready.append((key, self.__groups.pop(key)[2]))
+                    if self.__ready or (self.__closed and not self.__groups):
+                        break
+                    timeout = min((g[0] for g in self.__groups.values()), default=None)
+                    self.__condition.wait(None if timeout is None else max(0.0, timeout - now))
+                ready, self.__ready = self.__ready, []
+                finished = self.__closed and not self.__groups
+            for (src_lang, dest_lang), items in ready:
+                try:
+                    self.__executor.submit(self.__send, items, src_lang, dest_lang)
+                except RuntimeError:
+                    # Closed meanwhile: the batch is dropped
+                    for text, future in items:
+                        future.cancel()
+            if finished:
+                return
+
+    def __send(self, items, src_lang, dest_lang):
+        """Translates one batch and resolves each caller's future (private method)."""
+        # Drop callers that cancelled while waiting, and send duplicate texts once
+        items = [(text, future) for text, future in items if future.set_running_or_notify_cancel()]
+        if not items:
+            return
+        texts = list(dict.fromkeys(text for text, future in items))
+        try:
+            results = self.translate_batch(texts, src_lang, dest_lang)
+            if len(results) != len(texts):
+                raise ValueError(f"Expected {len(texts)} translations, got {len(results)}")
+            translations = dict(zip(texts, results))
+        except Exception as e:
+            for text, future in items:
+                future.set_exception(e)
+            return
+        self.batches_sent += 1
+        self.items_sent += len(texts)
+        for text, future in items:
+            future.set_result(translations[text])
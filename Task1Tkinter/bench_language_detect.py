@@ -0,0 +1,63 @@
+"""Accuracy and latency of the offline language detector.
+
+Runs the detector over the bundled test set (sentences that are not in the
+training samples) and reports per-language accuracy, misclassifications and
+per-text latency.
+
+    python bench_language_detect.py
+    python bench_language_detect.py --testset my_tests.jsonl --repeat 50
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+
+from language_detect import LanguageDetector
+
+TESTSET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'language_testset.jsonl')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the offline language detector.")
+    parser.add_argument('--testset', default=TESTSET_PATH,
+                        help='JSONL file of {"lang": ..., "text": ...} lines')
+    parser.add_argument('--repeat', type=int, default=20, help="timed runs per text")
+    args = parser.parse_args(argv)
+
+    with open(args.testset, encoding='utf-8') as f:
+        cases = [json.loads(line) for line in f if line.strip()]
+
+    started = time.perf_counter()
+    detector = LanguageDetector()
+    print(f"training: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    correct = Counter()
+    totals = Counter()
+    latencies = []
+    for case in cases:
+        language, confidence = detector.detect(case['text'])
+        totals[case['lang']] += 1
+        if language == case['lang']:
+            correct[case['lang']] += 1
+        else:
+            print(f"  {case['lang']} detected as {language} ({confidence:.2f}): {case['text']}")
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            detector.detect(case['text'])
+        latencies.append((time.perf_counter() - started) / args.repeat)
+
+    for lang in sorted(totals):
+        print(f"{lang:>6}: {correct[lang]}/{totals[lang]}")
+    latencies.sort()
+    print(f"accuracy: {sum(correct.values()) / len(cases):.1%} over {len(cases)} texts")
+    print(f"latency per text: mean {statistics.mean(latencies) * 1e6:.0f} us, "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1e6:.0f} us, "
+          f"max {latencies[-1] * 1e6:.0f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
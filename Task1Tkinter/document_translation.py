@@ -0,0 +1,157 @@
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Paragraph breaks, or whitespace following sentence-ending punctuation
+_BOUNDARY = re.compile(r'\n\s*\n|(?<=[.!?。！？؟।])\s+')
+
+
+def _segments(text):
+    """Yields sentence/paragraph segments, each ending with its own separator."""
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        yield text[start:match.end()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def _hard_split(segment, max_chars):
+    """Splits an oversized segment on whitespace, or anywhere if it has none."""
+    while len(segment) > max_chars:
+        cut = segment.rfind(' ', 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        yield segment[:cut]
+        segment = segment[cut:]
+    if segment:
+        yield segment
+
+
+def split_into_chunks(text, max_chars=4000):
+    """Splits text on sentence/paragraph boundaries into chunks of at most max_chars.
+
+    Chunks are exact slices of the input, so ''.join(chunks) == text.
+    """
+    chunks = []
+    current = ''
+    for segment in _segments(text):
+        for piece in _hard_split(segment, max_chars):
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ''
+            current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def translate_chunk(translate, chunk, src_lang, dest_lang):
+    """Translates one chunk, keeping its surrounding whitespace so paragraphs survive reassembly."""
+    core = chunk.strip()
+    if not core:
+        return chunk
+    leading = chunk[:len(chunk) - len(chunk.lstrip())]
+    trailing = chunk[len(chunk.rstrip()):]
+    return leading + translate(core, src_lang, dest_lang) + trailing
+
+
+def translate_in_chunks(translate, text, src_lang, dest_lang, chunk_size=4000):
+    """Translates a long text chunk by chunk on the calling thread."""
+    return ''.join(translate_chunk(translate, chunk, src_lang, dest_lang)
+                   for chunk in split_into_chunks(text, chunk_size))
+
+
+class DocumentTranslation:
+    """Translates a large document chunk by chunk on a bounded thread pool.
+
+    Chunks are translated concurrently but reported in document order:
+    on_chunk(index, text) fires as soon as a chunk and all chunks before it are done.
+    on_progress(done, total) fires for every finished chunk, and exactly one of
+    on_done() or on_error(exception) fires at the end unless the job is cancelled.
+    Pass a shared executor to run on an existing pool instead of a private one.
+    """
+
+    def __init__(self, translate, text, src_lang, dest_lang, max_workers=4, chunk_size=4000,
+                 on_chunk=None, on_progress=None, on_done=None, on_error=None, executor=None):
+        self.translate = translate
+        self.src_lang = src_lang
+        self.dest_lang = dest_lang
+        self.max_workers = max_workers
+        self.chunks = split_into_chunks(text, chunk_size)
+        self.on_chunk = on_chunk
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+
+        self.__results = [None] * len(self.chunks)
+        self.__next_to_emit = 0
+        self.__completed = 0
+        self.__failed = False
+        self.__lock = threading.Lock()
+        self.__cancelled = threading.Event()
+        self.__executor = executor
+        self.__owns_executor = executor is None
+        self.__futures = []
+
+    @property
+    def cancelled(self):
+        return self.__cancelled.is_set()
+
+    def start(self):
+        """Submits every chunk to the pool and returns immediately."""
+        if not self.chunks:
+            if self.on_done:
+                self.on_done()
+            return
+        if self.__owns_executor:
+            self.__executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                 thread_name_prefix='document')
+        self.__futures = [self.__executor.submit(self.__translate_chunk, index)
+                          for index in range(len(self.chunks))]
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=False)
+
+    def cancel(self):
+        """Stops the job; chunks not yet started are dropped."""
+        self.__cancelled.set()
+        for future in self.__futures:
+            future.cancel()
+
+    def __translate_chunk(self, index):
+        """Worker body for one chunk (private method)."""
+        if self.__cancelled.is_set():
+            return
+        try:
+            translated = translate_chunk(self.translate, self.chunks[index],
+                                         self.src_lang, self.dest_lang)
+        except Exception as e:
+            with self.__lock:
+                first_failure = not self.__failed
+                self.__failed = True
+            self.cancel()
+            if first_failure and self.on_error:
+                self.on_error(e)
+            return
+
+        with self.__lock:
+            if self.__cancelled.is_set():
+                return
+            self.__results[index] = translated
+            self.__completed += 1
+            completed = self.__completed
+            ready = []
+            while (self.__next_to_emit < len(self.chunks)
+                   and self.__results[self.__next_to_emit] is not None):
+                ready.append((self.__next_to_emit, self.__results[self.__next_to_emit]))
+                self.__next_to_emit += 1
+            finished = self.__next_to_emit == len(self.chunks)
+
+            # Callbacks run under the lock so chunks are always delivered in order
+            if self.on_chunk:
+                for ready_index, ready_text in ready:
+                    self.on_chunk(ready_index, ready_text)
+            if self.on_progress:
+                self.on_progress(completed, len(self.chunks))
+            if finished and self.on_done:
+                self.on_done()
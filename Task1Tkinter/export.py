@@ -0,0 +1,125 @@
+"""Streaming export of translation records to JSONL, CSV and TMX, and TMX import.
+
+Records are consumed from an iterator (e.g. HistoryStore.iter_records) and written
+one at a time, so exporting a large history never builds the whole document in
+memory. TMX files can be read back in to pre-fill the translation cache.
+"""
+import csv
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape, quoteattr
+
+FIELDS = ('source_lang', 'target_lang', 'source_text', 'translated_text', 'timestamp')
+FORMATS = ('jsonl', 'csv', 'tmx')
+XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+
+def export_jsonl(records, path):
+    """Writes one JSON object per record. Returns the number of records written."""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as file:
+        for record in records:
+            file.write(json.dumps({field: record.get(field) for field in FIELDS},
+                                  ensure_ascii=False) + '\n')
+            count += 1
+    return count
+
+
+def export_csv(records, path):
+    """Writes records as CSV with a header row. Returns the number of records written."""
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    return count
+
+
+def _tmx_date(timestamp):
+    """Converts a stored timestamp to the TMX date format (YYYYMMDDThhmmssZ)."""
+    try:
+        moment = datetime.fromisoformat(timestamp).astimezone(timezone.utc)
+    except (TypeError, ValueError):
+        return None
+    return moment.strftime('%Y%m%dT%H%M%SZ')
+
+
+def export_tmx(records, path, lang_code=lambda name: name):
+    """Writes records as a TMX 1.4 translation memory.
+
+    lang_code maps the stored language names (e.g. 'French') to language codes.
+    Returns the number of records written.
+    """
+    count = 0
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                   '<tmx version="1.4">\n'
+                   '  <header creationtool="TranslatorApp" creationtoolversion="1.0" '
+                   'segtype="sentence" o-tmf="TranslatorApp" adminlang="en" '
+                   'srclang="*all*" datatype="plaintext"/>\n'
+                   '  <body>\n')
+        for record in records:
+            date = _tmx_date(record.get('timestamp'))
+            file.write('    <tu%s>\n' % (f' creationdate="{date}"' if date else ''))
+            for lang, text in ((record['source_lang'], record['source_text']),
+                               (record['target_lang'], record['translated_text'])):
+                file.write('      <tuv xml:lang=%s><seg>%s</seg></tuv>\n'
+                           % (quoteattr(lang_code(lang)), escape(text or '')))
+            file.write('    </tu>\n')
+            count += 1
+        file.write('  </body>\n</tmx>\n')
+    return count
+
+
+EXPORTERS = {'jsonl': export_jsonl, 'csv': export_csv, 'tmx': export_tmx}
+
+
+def iter_tmx(path):
+    """Yields (source_text, source_lang, target_text, target_lang) pairs from a TMX file.
+
+    The first variant of each unit is the source unless the unit or header names a
+    srclang. The file is parsed incrementally and finished elements are freed.
+    """
+    default_src = None
+    context = ET.iterparse(path, events=('start', 'end'))
+    _, root = next(context)
+    for event, element in context:
+        if event == 'start':
+            if element.tag == 'header':
+                srclang = element.get('srclang')
+                default_src = None if srclang in (None, '*all*') else srclang.lower()
+            continue
+        if element.tag != 'tu':
+            continue
+        variants = []
+        for tuv in element.iter('tuv'):
+            lang = tuv.get(XML_LANG) or tuv.get('lang')
+            seg = tuv.find('seg')
+            if lang and seg is not None:
+                variants.append((lang.lower(), ''.join(seg.itertext())))
+        src_lang = (element.get('srclang') or '').lower() or default_src
+        source = next((v for v in variants if v[0] == src_lang), variants[0] if variants else None)
+        if source is not None:
+            for lang, text in variants:
+                if (lang, text) != source and text:
+                    yield source[1], source[0], text, lang
+        # Free the parsed unit so memory stays flat on large files
+        element.clear()
+        root.clear()
+
+
+def import_tmx(path, cache, batch_size=1000):
+    """Loads a TMX file into the translation cache. Returns the number of entries stored."""
+    stored = 0
+    batch = []
+    for source_text, src_lang, target_text, dest_lang in iter_tmx(path):
+        batch.append((source_text, src_lang, dest_lang, target_text))
+        if len(batch) >= batch_size:
+            stored += cache.put_many(batch)
+            batch = []
+    if batch:
+        stored += cache.put_many(batch)
+    return stored
@@ -0,0 +1,171 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+TABLES = ('history', 'favorites')
+COLUMNS = ('id', 'source_text', 'translated_text', 'source_lang', 'target_lang', 'timestamp')
+
+
+def _fts_query(search):
+    """Turns free text into an FTS5 query matching every word as a prefix."""
+    terms = search.split()
+    return ' '.join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+class HistoryStore:
+    """Durable history and favorites kept in the app's SQLite database.
+
+    Writes are buffered and committed in batches, either when `batch_size` records
+    are pending or every `flush_interval` seconds from a background thread. Reads
+    are paginated newest first by id, with optional full-text search (FTS5).
+    """
+
+    def __init__(self, db_path='translations.db', batch_size=50, flush_interval=1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.__lock = threading.RLock()
+        self.__pending = {table: [] for table in TABLES}
+        self.__conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.__conn.row_factory = sqlite3.Row
+        self.fts_enabled = True
+        self.__create_schema()
+
+        self.__closed = threading.Event()
+        self.__flusher = threading.Thread(target=self.__flush_loop, name='history-flush', daemon=True)
+        self.__flusher.start()
+
+    def __create_schema(self):
+        """Creates tables, indexes and full-text indexes if missing (private method)."""
+        conn = self.__conn
+        for table in TABLES:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_text TEXT,
+                    translated_text TEXT,
+                    source_lang TEXT,
+                    target_lang TEXT,
+                    timestamp DATETIME
+                )""")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_langs "
+                         f"ON {table} (source_lang, target_lang)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_timestamp ON {table} (timestamp)")
+
+            exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?",
+                                  (f"{table}_fts",)).fetchone()
+            if exists:
+                continue
+            try:
+                conn.execute(f"""
+                    CREATE VIRTUAL TABLE {table}_fts USING fts5(
+                        source_text, translated_text, content='{table}', content_rowid='id')""")
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5: fall back to LIKE searches
+                self.fts_enabled = False
+                continue
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {table}_fts (rowid, source_text, translated_text)
+                    VALUES (new.id, new.source_text, new.translated_text);
+                END""")
+            conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {table}_fts ({table}_fts, rowid, source_text, translated_text)
+                    VALUES ('delete', old.id, old.source_text, old.translated_text);
+                END""")
+            # Index rows written before full-text search existed
+            conn.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+        conn.commit()
+
+    def add(self, table, record):
+        """Queues a record ({'source_text', 'translated_text', 'source_lang', 'target_lang'})."""
+        row = (record['source_text'], record['translated_text'],
+               record['source_lang'], record['target_lang'],
+               record.get('timestamp') or datetime.now().isoformat(sep=' ', timespec='seconds'))
+        with self.__lock:
+            self.__pending[table].append(row)
+            if len(self.__pending[table]) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """Commits all queued records in one transaction."""
+        with self.__lock:
+            for table, rows in self.__pending.items():
+                if rows:
+                    self.__conn.executemany(
+                        f"INSERT INTO {table} (source_text, translated_text, source_lang, "
+                        f"target_lang, timestamp) VALUES (?, ?, ?, ?, ?)", rows)
+                    rows.clear()
+            self.__conn.commit()
+
+    def is_empty(self, table):
+        with self.__lock:
+            self.flush()
+            return self.__conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None
+
+    def count(self, table, search=None):
+        """Returns the number of records, optionally only those matching search."""
+        where, params = self.__search_clause(table, search)
+        with self.__lock:
+            self.flush()
+            return self.__conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE {where}", params).fetchone()[0]
+
+    def page(self, table, before_id=None, limit=100, search=None):
+        """Returns up to `limit` records older than before_id, newest first.
+
+        Pass the id of the last record of a page to get the next one; paging by id
+        stays fast no matter how deep the user scrolls.
+        """
+        where, params = self.__search_clause(table, search)
+        if before_id is not None:
+            where += " AND id < ?"
+            params = params + (before_id,)
+        with self.__lock:
+            self.flush()
+            rows = self.__conn.execute(
+                f"SELECT {', '.join(COLUMNS)} FROM {table} WHERE {where} "
+                f"ORDER BY id DESC LIMIT ?", params + (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_records(self, table, search=None, page_size=500):
+        """Yields every record, newest first, fetching one page at a time."""
+        before_id = None
+        while True:
+            records = self.page(table, before_id=before_id, limit=page_size, search=search)
+            yield from records
+            if len(records) < page_size:
+                return
+            before_id = records[-1]['id']
+
+    def clear(self, table):
+        """Deletes every record in the table."""
+        with self.__lock:
+            self.__pending[table].clear()
+            self.__conn.execute(f"DELETE FROM {table}")
+            self.__conn.commit()
+
+    def close(self):
+        """Flushes pending records and closes the database."""
+        self.__closed.set()
+        with self.__lock:
+            self.flush()
+            self.__conn.close()
+
+    def __search_clause(self, table, search):
+        """Builds the WHERE clause for an optional search (private method)."""
+        if not search or not search.strip():
+            return "1", ()
+        if self.fts_enabled:
+            return (f"id IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)",
+                    (_fts_query(search),))
+        pattern = f"%{search.strip()}%"
+        return "(source_text LIKE ? OR translated_text LIKE ?)", (pattern, pattern)
+
+    def __flush_loop(self):
+        """Background thread committing buffered writes periodically (private method)."""
+        while not self.__closed.wait(self.flush_interval):
+            with self.__lock:
+                if not self.__closed.is_set():
+                    self.flush()
@@ -0,0 +1,119 @@
+import contextlib
+import cProfile
+import io
+import json
+import logging
+import logging.handlers
+import pstats
+import threading
+import time
+from collections import Counter, defaultdict, deque
+
+
+class Instrumentation:
+    """Timing spans for the translator, logged to app.log as JSON lines.
+
+    Each span is written as one line ({"ts", "span", "ms", "thread", ...fields})
+    and its duration is kept in a rolling window per span name, from which
+    summary() reports p50/p95 latency for the diagnostics window. Failures are
+    logged to the same file as error entries and counted by errors(). Spans and
+    errors can be recorded from any thread.
+    """
+
+    def __init__(self, log_path='app.log', window=500, max_log_bytes=5 * 1024 * 1024):
+        self.log_path = log_path
+        self.__samples = defaultdict(lambda: deque(maxlen=window))
+        self.__counts = Counter()
+        self.__errors = {}  # name -> [count, last message]
+        self.__lock = threading.Lock()
+        self.__profiler = None
+        self.__logger = logging.getLogger(f'translator.spans.{id(self)}')
+        self.__logger.setLevel(logging.INFO)
+        self.__logger.propagate = False
+        self.__handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=max_log_bytes, backupCount=2, encoding='utf-8')
+        self.__handler.setFormatter(logging.Formatter('%(message)s'))
+        self.__logger.addHandler(self.__handler)
+
+    @contextlib.contextmanager
+    def span(self, name, **fields):
+        """Times the with-block as span `name`; the block may add fields to the yielded dict."""
+        started = time.perf_counter()
+        try:
+            yield fields
+        except BaseException as e:
+            fields['error'] = type(e).__name__
+            raise
+        finally:
+            self.record(name, time.perf_counter() - started, **fields)
+
+    def record(self, name, seconds, **fields):
+        """Records a span measured elsewhere, e.g. from a request's submit to its completion."""
+        with self.__lock:
+            self.__samples[name].append(seconds)
+            self.__counts[name] += 1
+        entry = {'ts': round(time.time(), 3), 'span': name, 'ms': round(seconds * 1000, 3),
+                 'thread': threading.current_thread().name}
+        entry.update(fields)
+        self.__logger.info(json.dumps(entry, ensure_ascii=False, default=str))
+
+    def error(self, name, error, **fields):
+        """Logs a failure reported as `name` (e.g. a failed background task) as an error entry."""
+        message = str(error)
+        with self.__lock:
+            entry = self.__errors.setdefault(name, [0, ''])
+            entry[0] += 1
+            entry[1] = message
+        entry = {'ts': round(time.time(), 3), 'level': 'error', 'span': name,
+                 'error': type(error).__name__, 'message': message,
+                 'thread': threading.current_thread().name}
+        entry.update(fields)
+        self.__logger.error(json.dumps(entry, ensure_ascii=False, default=str))
+
+    def errors(self):
+        """Returns {name: {'count', 'last'}} for every kind of error reported so far."""
+        with self.__lock:
+            return {name: {'count': count, 'last': last}
+                    for name, (count, last) in sorted(self.__errors.items())}
+
+    def summary(self):
+        """Returns {span: {'count', 'p50', 'p95', 'max'}} with latencies in seconds.
+
+        count is the total number of spans; the percentiles cover the recent window.
+        """
+        with self.__lock:
+            snapshot = {name: (sorted(samples), self.__counts[name])
+                        for name, samples in self.__samples.items() if samples}
+        return {name: {'count': count,
+                       'p50': samples[len(samples) // 2],
+                       'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+                       'max': samples[-1]}
+                for name, (samples, count) in sorted(snapshot.items())}
+
+    @property
+    def profiling(self):
+        return self.__profiler is not None
+
+    def start_profiling(self):
+        """Starts a cProfile capture of the calling thread (the Tk main loop in the app)."""
+        if self.__profiler is None:
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+
+    def stop_profiling(self, path='translator.prof', top=25):
+        """Stops the capture, saves it to path and returns the top functions as text."""
+        profiler, self.__profiler = self.__profiler, None
+        if profiler is None:
+            return ''
+        profiler.disable()
+        profiler.dump_stats(path)
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(top)
+        return output.getvalue()
+
+    def close(self):
+        if self.__profiler is not None:
+            self.__profiler.disable()
+            self.__profiler = None
+        self.__logger.removeHandler(self.__handler)
+        self.__handler.close()
@@ -0,0 +1,150 @@
+import json
+import math
+import os
+import threading
+import unicodedata
+from collections import Counter
+
+SAMPLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'language_samples.json')
+
+# Languages that share a script are told apart by the n-gram model; a script
+# used by a single language decides on its own
+SCRIPT_LANGUAGES = {
+    'latin': ('af', 'de', 'en', 'es', 'fr', 'pt'),
+    'arabic': ('ar', 'ur'),
+    'cyrillic': ('ru',),
+    'devanagari': ('hi',),
+    'kana': ('ja',),
+    'han': ('zh-cn', 'zh-tw'),
+}
+
+# Common characters written differently in Simplified and Traditional Chinese
+_SIMPLIFIED = ('这个们来时说国会学对过还后里与为么经开关问题话头点东车长门见现实体处应发当让从电书语样无'
+               '欢觉亲万号听请边认谢药买卖场鲜园飞机爱钱银进运动图华汉岁师员业产记义术网线码写读识难气'
+               '馆饭鱼鸟马龙节乐医级练习历错灯热顿帮两几谁视览该单层楼广厅县区团农庄办劳务报纸杂词简传'
+               '统续继给终结组织红绿蓝黄颜风云阳阴树叶费贵货质赛选远连达闻间闭闹阅钟铁针')
+_TRADITIONAL = ('這個們來時說國會學對過還後裡與為麼經開關問題話頭點東車長門見現實體處應發當讓從電書語樣無'
+                '歡覺親萬號聽請邊認謝藥買賣場鮮園飛機愛錢銀進運動圖華漢歲師員業產記義術網線碼寫讀識難氣'
+                '館飯魚鳥馬龍節樂醫級練習歷錯燈熱頓幫兩幾誰視覽該單層樓廣廳縣區團農莊辦勞務報紙雜詞簡傳'
+                '統續繼給終結組織紅綠藍黃顏風雲陽陰樹葉費貴貨質賽選遠連達聞間閉鬧閱鐘鐵針')
+
+
+def _script(char):
+    """Returns the script of a letter, or None for anything else."""
+    code = ord(char)
+    if 0x3040 <= code <= 0x30FF:
+        return 'kana'
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF:
+        return 'han'
+    if 0x0600 <= code <= 0x06FF or 0x0750 <= code <= 0x077F:
+        return 'arabic'
+    if 0x0900 <= code <= 0x097F:
+        return 'devanagari'
+    if 0x0400 <= code <= 0x04FF:
+        return 'cyrillic'
+    if char.isalpha() and code < 0x0250:
+        return 'latin'
+    return None
+
+
+def _letters(text):
+    """Lowercases text and replaces everything but letters with single spaces."""
+    text = unicodedata.normalize('NFC', text).lower()
+    cleaned = ''.join(char if char.isalpha() or unicodedata.category(char).startswith('M') else ' '
+                      for char in text)
+    return ' '.join(cleaned.split())
+
+
+def ngrams(text, max_n=3):
+    """Yields the character 1..max_n-grams of cleaned text, each word padded with spaces."""
+    for word in text.split(' '):
+        padded = f" {word} "
+        for n in range(1, max_n + 1):
+            for i in range(len(padded) - n + 1):
+                gram = padded[i:i + n]
+                if gram != ' ':
+                    yield gram
+
+
+class LanguageDetector:
+    """Offline language identifier for the languages the app translates.
+
+    The dominant script narrows the candidates first (kana means Japanese,
+    Devanagari means Hindi, and so on). Languages sharing a script are then
+    scored with a naive Bayes model over character 1-3-grams trained on the
+    bundled samples; Chinese is split by counting Simplified-only and
+    Traditional-only characters. Detecting a sentence takes well under a
+    millisecond, so it runs before every Auto-Detect translation.
+    """
+
+    def __init__(self, samples_path=SAMPLES_PATH, max_n=3):
+        self.max_n = max_n
+        with open(samples_path, encoding='utf-8') as f:
+            samples = json.load(f)
+        self.languages = tuple(samples)
+        self.__models = {}  # script -> (language -> (gram log-probabilities, unseen log-probability))
+        for script, languages in SCRIPT_LANGUAGES.items():
+            counts = {lang: Counter(ngrams(_letters(' '.join(samples[lang])), max_n))
+                      for lang in languages if lang in samples}
+            vocabulary = len(set().union(*counts.values())) + 1 if counts else 1
+            model = {}
+            for lang, grams in counts.items():
+                total = sum(grams.values()) + vocabulary  # Add-one smoothing
+                model[lang] = ({gram: math.log((count + 1) / total) for gram, count in grams.items()},
+                               math.log(1 / total))
+            self.__models[script] = model
+
+    def detect(self, text):
+        """Returns (language code, confidence between 0 and 1), or (None, 0.0) without letters."""
+        cleaned = _letters(text)
+        scripts = Counter(script for script in map(_script, cleaned) if script)
+        if not scripts:
+            return None, 0.0
+        script = scripts.most_common(1)[0][0]
+        if script == 'han' and scripts['kana']:
+            script = 'kana'  # Japanese mixes kanji with kana; Chinese never uses kana
+        languages = SCRIPT_LANGUAGES[script]
+        if len(languages) == 1:
+            return languages[0], 1.0
+        if script == 'han':
+            result = self.__detect_chinese(cleaned)
+            if result is not None:
+                return result
+        return self.__classify(cleaned, self.__models[script])
+
+    def __detect_chinese(self, cleaned):
+        """Decides Simplified vs Traditional from variant characters (private method)."""
+        simplified = sum(char in _SIMPLIFIED for char in cleaned)
+        traditional = sum(char in _TRADITIONAL for char in cleaned)
+        if simplified == traditional:
+            return None
+        best = 'zh-cn' if simplified > traditional else 'zh-tw'
+        return best, max(simplified, traditional) / (simplified + traditional)
+
+    def __classify(self, cleaned, model):
+        """Scores text against each candidate language (private method)."""
+        scores = dict.fromkeys(model, 0.0)
+        for gram in ngrams(cleaned, self.max_n):
+            for lang, (log_probs, unseen) in model.items():
+                scores[lang] += log_probs.get(gram, unseen)
+        best = max(scores, key=scores.get)
+        # Posterior probability of the best language, assuming equal priors
+        total = sum(math.exp(score - scores[best]) for score in scores.values())
+        return best, 1 / total
+
+
+_detector = None
+_detector_lock = threading.Lock()
+
+
+def detect_language(text, min_confidence=0.8):
+    """Returns the language code of text, or None if it can't be told confidently.
+
+    The shared detector is trained on first use.
+    """
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = LanguageDetector()
+    language, confidence = _detector.detect(text)
+    return language if confidence >= min_confidence else None
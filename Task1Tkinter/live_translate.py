@@ -0,0 +1,115 @@
+import itertools
+import re
+from difflib import SequenceMatcher
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+
+def split_paragraphs(text):
+    """Splits text into paragraphs, each keeping the blank lines that follow it."""
+    paragraphs = []
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(text):
+        paragraphs.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        paragraphs.append(text[start:])
+    return paragraphs
+
+
+def _surrounding_whitespace(paragraph):
+    core = paragraph.strip()
+    leading = paragraph[:len(paragraph) - len(paragraph.lstrip())]
+    trailing = paragraph[len(paragraph.rstrip()):]
+    return core, leading, trailing
+
+
+class LiveDocument:
+    """Keeps source paragraphs aligned with their translations for live mode.
+
+    update() diffs the new source text against the previous one and returns the
+    paragraphs that need translating plus the edits that keep the translated text
+    in the same layout. set_translation() then returns the edit for one finished
+    paragraph. Edits are (start offset, old length, new text) in characters of the
+    translated text, to be applied to a tk.Text in the order given.
+    """
+
+    def __init__(self):
+        self.paragraphs = []
+        self.translations = []  # Rendered text per paragraph, including its trailing whitespace
+        self.__tokens = []  # Identifies each paragraph slot across edits
+        self.__token_counter = itertools.count()
+
+    def reset(self):
+        self.paragraphs = []
+        self.translations = []
+        self.__tokens = []
+
+    def update(self, text):
+        """Diffs text against the previous version.
+
+        Returns (edits, pending) where pending is a list of (token, core text)
+        for paragraphs that must be translated; whitespace-only paragraphs are
+        resolved immediately.
+        """
+        new_paragraphs = split_paragraphs(text)
+        matcher = SequenceMatcher(a=self.paragraphs, b=new_paragraphs, autojunk=False)
+        edits = []
+        pending = []
+        translations = []
+        tokens = []
+        offset = 0
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            old_block = self.translations[i1:i2]
+            old_length = sum(len(t) for t in old_block)
+            if tag == 'equal':
+                translations.extend(old_block)
+                tokens.extend(self.__tokens[i1:i2])
+                offset += old_length
+                continue
+
+            new_block = []
+            for position, paragraph in enumerate(new_paragraphs[j1:j2]):
+                core, leading, trailing = _surrounding_whitespace(paragraph)
+                token = next(self.__token_counter)
+                tokens.append(token)
+                if not core:
+                    new_block.append(paragraph)
+                    continue
+                pending.append((token, core))
+                # Show the old translation of an edited paragraph until the new one arrives
+                if i2 - i1 == j2 - j1:
+                    old_core = old_block[position].strip()
+                    new_block.append(leading + old_core + trailing if old_core else leading + trailing)
+                else:
+                    new_block.append(leading + trailing)
+            translations.extend(new_block)
+            new_text = ''.join(new_block)
+            edits.append((offset, old_length, new_text))
+            offset += len(new_text)
+
+        self.paragraphs = new_paragraphs
+        self.translations = translations
+        self.__tokens = tokens
+        return edits, pending
+
+    def set_translation(self, token, translated_core):
+        """Stores a finished translation; returns its edit, or None if the paragraph is gone."""
+        try:
+            index = self.__tokens.index(token)
+        except ValueError:
+            return None
+        _, leading, trailing = _surrounding_whitespace(self.paragraphs[index])
+        rendered = leading + translated_core + trailing
+        start = sum(len(t) for t in self.translations[:index])
+        old_length = len(self.translations[index])
+        self.translations[index] = rendered
+        return (start, old_length, rendered)
+
+    def is_current(self, token):
+        """Returns True while the paragraph slot for token still exists."""
+        return token in self.__tokens
+
+    def text(self):
+        """Returns the full translated text."""
+        return ''.join(self.translations)
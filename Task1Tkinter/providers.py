@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+
+
+class BatchNotSupported(Exception):
+    """Raised by translate_batch() when the texts cannot go out as one request.
+
+    The caller should translate them one by one with translate(), so each
+    request is rate limited on its own.
+    """
+
+
+class TranslationProvider:
+    """Base class for translation backends.
+
+    Subclasses implement _translate_once() (and optionally _translate_batch_once());
+    translate() and translate_batch() wrap them with retries and exponential backoff
+    so every backend gets the same error handling. Without _translate_batch_once(),
+    translate_batch() raises BatchNotSupported.
+    """
+
+    name = 'base'
+
+    def __init__(self, timeout=10.0, retries=3, backoff=0.5, max_backoff=8.0):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def translate(self, text, src_lang, dest_lang):
+        """Translates text, retrying transient failures with backoff."""
+        return self._with_retries(self._translate_once, text, src_lang, dest_lang)
+
+    def translate_batch(self, texts, src_lang, dest_lang):
+        """Translates a list of texts, in one request where the backend allows it."""
+        return self._with_retries(self._translate_batch_once, texts, src_lang, dest_lang)
+
+    def _with_retries(self, function, *args):
+        attempt = 0
+        while True:
+            try:
+                return function(*args)
+            except BatchNotSupported:
+                raise  # Not a transient failure
+            except Exception:
+                attempt += 1
+                if attempt > self.retries:
+                    raise
+                # Exponential backoff with jitter so parallel workers don't retry in lockstep
+                delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+                time.sleep(delay * random.uniform(0.5, 1.0))
+
+    def _translate_once(self, text, src_lang, dest_lang):
+        raise NotImplementedError
+
+    def _translate_batch_once(self, texts, src_lang, dest_lang):
+        raise BatchNotSupported(f"{self.name} cannot translate a batch in one request")
+
+    def close(self):
+        """Releases any resources held by the provider."""
+
+
+class GoogleTranslateProvider(TranslationProvider):
+    """googletrans backend sharing one HTTP client (and its connection pool) across threads.
+
+    googletrans is imported on the first translation, not at construction, so
+    creating the provider costs nothing at app startup.
+    """
+
+    name = 'google'
+
+    def __init__(self, timeout=10.0, retries=3, backoff=0.5, max_backoff=8.0, service_urls=None):
+        super().__init__(timeout, retries, backoff, max_backoff)
+        self.service_urls = service_urls
+        self.__translator = None
+        self.__lock = threading.Lock()
+
+    def __get_translator(self):
+        """Creates the shared Translator on first use (private method)."""
+        if self.__translator is None:
+            with self.__lock:
+                if self.__translator is None:
+                    from googletrans import Translator
+                    kwargs = {'timeout': self.timeout}
+                    if self.service_urls:
+                        kwargs['service_urls'] = self.service_urls
+                    # One long-lived Translator means one HTTP client, so connections and
+                    # TLS sessions are reused by every worker thread
+                    self.__translator = Translator(**kwargs)
+        return self.__translator
+
+    def _translate_once(self, text, src_lang, dest_lang):
+        result = self.__get_translator().translate(text, src=src_lang, dest=dest_lang)
+        return result.text
+
+    def _translate_batch_once(self, texts, src_lang, dest_lang):
+        # googletrans accepts a list but still sends one request per item, so
+        # single-line segments are packed into one newline-separated request.
+        # Anything else is left to the caller to send text by text, under its rate limit.
+        if any('\n' in text for text in texts):
+            raise BatchNotSupported("Texts with line breaks cannot be packed into one request")
+        translated = self._translate_once('\n'.join(texts), src_lang, dest_lang).split('\n')
+        if len(translated) != len(texts):
+            raise BatchNotSupported(f"Expected {len(texts)} lines back, got {len(translated)}")
+        return [line.strip() for line in translated]
+
+    def close(self):
+        client = getattr(self.__translator, 'client', None)
+        if client is not None:
+            client.close()
+
+
+class StubProvider(TranslationProvider):
+    """Offline provider for tests and benchmarks; never touches the network.
+
+    The "translation" is the text tagged with the target language, optionally
+    after a fixed artificial latency.
+    """
+
+    name = 'stub'
+
+    def __init__(self, latency=0.0, timeout=10.0, retries=0, backoff=0.0, max_backoff=0.0):
+        super().__init__(timeout, retries, backoff, max_backoff)
+        self.latency = latency
+        self.calls = 0
+        self.__lock = threading.Lock()
+
+    def _translate_once(self, text, src_lang, dest_lang):
+        with self.__lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return f"[{dest_lang}] {text}"
+
+    def _translate_batch_once(self, texts, src_lang, dest_lang):
+        # One simulated round-trip for the whole batch
+        with self.__lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return [f"[{dest_lang}] {text}" for text in texts]
+
+
+PROVIDERS = {
+    GoogleTranslateProvider.name: GoogleTranslateProvider,
+    StubProvider.name: StubProvider,
+}
+
+
+def create_provider(name='google', **options):
+    """Creates a provider by name ('google' or 'stub')."""
+    try:
+        provider_class = PROVIDERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown translation provider: {name}") from None
+    return provider_class(**options)
@@ -0,0 +1,143 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Token-bucket rate limiter shared by every thread that sends requests.
+
+    Tokens refill continuously at `rate` per second up to `burst`; each request
+    takes one token and waits if none are left.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.__tokens = self.burst
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def acquire(self, timeout=None):
+        """Takes one token, waiting up to timeout seconds. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+                self.__updated = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return True
+                wait = (1 - self.__tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def set_rate(self, rate):
+        """Changes the refill rate, keeping the tokens earned so far."""
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+            self.__updated = now
+            self.rate = float(rate)
+
+    def release(self, ok=True, latency=None):
+        """Token buckets need no release; present so it can stand in for AdaptiveRateLimiter."""
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request waited longer than max_wait for the rate limiter."""
+
+
+class AdaptiveRateLimiter:
+    """Token-bucket rate limit plus an adaptive cap on concurrent requests.
+
+    Callers acquire() before a request and release(ok, latency) after it. Errors
+    and latency spikes (more than `latency_spike` times the running average)
+    halve both the concurrency cap and the request rate; each healthy response
+    ramps them back up (additive increase, multiplicative decrease), so bulk jobs
+    slow down under pressure instead of failing.
+    """
+
+    def __init__(self, rate=5.0, max_concurrency=4, min_rate=0.5, min_concurrency=1,
+                 latency_spike=3.0, max_wait=None, cooldown=1.0):
+        self.bucket = RateLimiter(rate)
+        self.max_rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.latency_spike = latency_spike
+        self.max_wait = max_wait
+        self.cooldown = cooldown
+        self.rejected = 0
+        self.errors = 0
+        self.__limit = float(max_concurrency)
+        self.__in_flight = 0
+        self.__waiting = 0
+        self.__latency = None  # Moving average of successful request latency
+        self.__last_decrease = 0.0
+        self.__condition = threading.Condition()
+
+    def acquire(self):
+        """Waits for a free slot and a token; raises RateLimitExceeded after max_wait seconds."""
+        deadline = None if self.max_wait is None else time.monotonic() + self.max_wait
+        with self.__condition:
+            self.__waiting += 1
+            try:
+                while self.__in_flight >= int(self.__limit):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self.__reject()
+                    self.__condition.wait(remaining)
+                self.__in_flight += 1
+            finally:
+                self.__waiting -= 1
+
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.bucket.acquire(remaining):
+            with self.__condition:
+                self.__in_flight -= 1
+                self.__condition.notify()
+                self.__reject()
+
+    def release(self, ok=True, latency=None):
+        """Reports the outcome of a request and adapts the limits."""
+        with self.__condition:
+            self.__in_flight -= 1
+            spike = (ok and latency is not None and self.__latency is not None
+                     and latency > self.latency_spike * self.__latency)
+            if not ok:
+                self.errors += 1
+            if not ok or spike:
+                now = time.monotonic()
+                # One burst of failures should only back off once
+                if now - self.__last_decrease >= self.cooldown:
+                    self.__last_decrease = now
+                    self.__limit = max(self.min_concurrency, self.__limit / 2)
+                    self.bucket.set_rate(max(self.min_rate, self.bucket.rate / 2))
+            else:
+                self.__limit = min(self.max_concurrency, self.__limit + 1 / self.__limit)
+                self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.max_rate / 20))
+            if ok and latency is not None:
+                self.__latency = latency if self.__latency is None else 0.8 * self.__latency + 0.2 * latency
+            self.__condition.notify_all()
+
+    def metrics(self):
+        """Returns the current rate, concurrency, queue depth and counters."""
+        with self.__condition:
+            return {
+                'rate': self.bucket.rate,
+                'concurrency_limit': int(self.__limit),
+                'in_flight': self.__in_flight,
+                'queue_depth': self.__waiting,
+                'rejected': self.rejected,
+                'errors': self.errors,
+                'average_latency': self.__latency,
+            }
+
+    def __reject(self):
+        """Counts and raises a rejection; called with the condition held (private method)."""
+        self.rejected += 1
+        raise RateLimitExceeded("Too many translation requests are waiting; try again shortly.")
@@ -0,0 +1,135 @@
+import contextlib
+import hashlib
+import logging
+import os
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SpeechWorker(threading.Thread):
+    """Long-lived text-to-speech thread that owns the pyttsx3 engine.
+
+    pyttsx3 engines must not be driven from several threads at once, so every
+    request is queued here and spoken one after another. Synthesized audio is
+    cached on disk keyed by (text, voice, rate), so replaying a phrase only plays
+    the saved file instead of synthesizing it again. With `instrumentation`,
+    synthesis and playback are timed as 'speech.synthesize' and 'speech.play' spans.
+    """
+
+    def __init__(self, cache_dir='tts_cache', max_cache_files=500, rate=None,
+                 on_voices=None, on_error=None, instrumentation=None):
+        super().__init__(name='speech', daemon=True)
+        self.cache_dir = cache_dir
+        self.max_cache_files = max_cache_files
+        self.rate = rate
+        self.on_voices = on_voices
+        self.on_error = on_error
+        self.instrumentation = instrumentation
+        self.voices = {}  # Voice name -> voice id, filled in once the engine is up
+        self.__requests = queue.Queue()
+        self.__engine = None
+
+    def speak(self, text, voice_name=None):
+        """Queues text to be spoken with the named voice (or the default voice)."""
+        self.__requests.put((text, voice_name))
+
+    def stop(self):
+        """Asks the worker to finish after the current request."""
+        self.__requests.put(None)
+
+    def pending(self):
+        """Returns the number of requests waiting to be spoken."""
+        return self.__requests.qsize()
+
+    def run(self):
+        try:
+            import pyttsx3
+            self.__engine = pyttsx3.init()
+            self.voices = {voice.name: voice.id for voice in self.__engine.getProperty('voices')}
+            if self.rate is None:
+                self.rate = self.__engine.getProperty('rate')
+        except Exception as e:
+            self.__report(e)
+            return
+        if self.on_voices:
+            self.on_voices(list(self.voices))
+
+        while True:
+            request = self.__requests.get()
+            if request is None:
+                break
+            try:
+                self.__speak(*request)
+            except Exception as e:
+                self.__report(e)
+        self.__engine.stop()
+
+    def audio_path(self, text, voice_id):
+        """Returns the cache file for this (text, voice, rate) combination."""
+        key = hashlib.sha256(f"{voice_id}\0{self.rate}\0{text}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + '.wav')
+
+    def __speak(self, text, voice_name):
+        """Plays cached audio, synthesizing it first on a cache miss (private method)."""
+        voice_id = self.voices.get(voice_name)  # Dict lookup instead of scanning every voice
+        path = self.audio_path(text, voice_id)
+        if os.path.exists(path):
+            os.utime(path)  # Keep recently played audio from being pruned
+        else:
+            with self.__span('speech.synthesize', chars=len(text)):
+                synthesized = self.__synthesize(text, voice_id, path)
+            if not synthesized:
+                # Saving to a file is not supported by every driver; speak directly instead
+                with self.__span('speech.say', chars=len(text)):
+                    self.__engine.say(text)
+                    self.__engine.runAndWait()
+                return
+        from playsound import playsound
+        with self.__span('speech.play', chars=len(text)):
+            playsound(path)
+
+    def __synthesize(self, text, voice_id, path):
+        """Renders text to an audio file; returns False if the driver produced nothing."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if voice_id:
+            self.__engine.setProperty('voice', voice_id)
+        self.__engine.setProperty('rate', self.rate)
+        temp_path = path + '.part'
+        try:
+            self.__engine.save_to_file(text, temp_path)
+            self.__engine.runAndWait()
+            if not os.path.exists(temp_path) or os.path.getsize(temp_path) == 0:
+                return False
+            os.replace(temp_path, path)
+        finally:
+            # Don't leave a partial file in the cache when synthesis failed
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self.__prune_cache()
+        return True
+
+    def __prune_cache(self):
+        """Deletes the oldest cached files beyond max_cache_files (private method)."""
+        files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                 if name.endswith('.wav')]
+        if len(files) <= self.max_cache_files:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.max_cache_files]:
+            os.remove(path)
+
+    def __span(self, name, **fields):
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.span(name, **fields)
+
+    def __report(self, e):
+        # Logged to app.log through the instrumentation, or to the logging module without it
+        if self.instrumentation is not None:
+            self.instrumentation.error('speech', e)
+        else:
+            logger.error("Text-to-Speech Error: %s", e)
+        if self.on_error:
+            self.on_error(e)
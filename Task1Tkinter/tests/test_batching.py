@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from batching import TranslationBatcher
+
+
+class RecordingBackend:
+    """translate_batch stand-in that records every batch it is sent."""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, texts, src_lang, dest_lang):
+        with self.lock:
+            self.batches.append((list(texts), src_lang, dest_lang))
+        return [f"[{dest_lang}] {text}" for text in texts]
+
+
+def test_requests_for_one_pair_go_out_as_one_batch():
+    backend = RecordingBackend()
+    batcher = TranslationBatcher(backend, max_delay=0.05)
+    futures = [batcher.submit(text, 'en', 'fr') for text in ('a', 'b', 'a', 'c')]
+    assert [f.result(timeout=5) for f in futures] == ['[fr] a', '[fr] b', '[fr] a', '[fr] c']
+    # Duplicate texts are sent once
+    assert backend.batches == [(['a', 'b', 'c'], 'en', 'fr')]
+    assert batcher.batches_sent == 1
+    assert batcher.items_sent == 3
+    batcher.close()
+
+
+def test_language_pairs_are_batched_separately():
+    backend = RecordingBackend()
+    batcher = TranslationBatcher(backend, max_delay=0.05)
+    french = batcher.submit('a', 'en', 'fr')
+    german = batcher.submit('a', 'en', 'de')
+    assert french.result(timeout=5) == '[fr] a'
+    assert german.result(timeout=5) == '[de] a'
+    assert sorted(batch[2] for batch in backend.batches) == ['de', 'fr']
+    batcher.close()
+
+
+def test_full_groups_are_split_by_items_and_chars():
+    backend = RecordingBackend()
+    batcher = TranslationBatcher(backend, max_items=2, max_chars=10, max_delay=0.05)
+    futures = [batcher.submit(text, 'en', 'fr') for text in ('a', 'b', 'c', 'x' * 10)]
+    for future in futures:
+        future.result(timeout=5)
+    # 'a' and 'b' fill a group; 'c' plus ten more characters would pass max_chars
+    assert sorted(texts for texts, _, _ in backend.batches) == [['a', 'b'], ['c'], ['x' * 10]]
+    batcher.close()
+
+
+def test_batch_errors_reach_every_caller():
+    def failing(texts, src_lang, dest_lang):
+        raise ConnectionError("offline")
+
+    batcher = TranslationBatcher(failing, max_delay=0.01)
+    futures = [batcher.submit(text, 'en', 'fr') for text in ('a', 'b')]
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result(timeout=5)
+    batcher.close()
+
+
+def test_wrong_number_of_results_is_an_error():
+    batcher = TranslationBatcher(lambda texts, src, dest: ['only one'], max_delay=0.01)
+    futures = [batcher.submit(text, 'en', 'fr') for text in ('a', 'b')]
+    with pytest.raises(ValueError):
+        futures[0].result(timeout=5)
+    batcher.close()
+
+
+def test_close_cancels_pending_requests():
+    backend = RecordingBackend()
+    batcher = TranslationBatcher(backend, max_delay=60)
+    future = batcher.submit('a', 'en', 'fr')
+    batcher.close()
+    assert future.cancelled()
+    assert backend.batches == []
+    with pytest.raises(RuntimeError):
+        batcher.submit('b', 'en', 'fr')
@@ -0,0 +1,65 @@
+from live_translate import LiveDocument, split_paragraphs
+
+
+def apply_edits(text, edits):
+    for start, old_length, new_text in edits:
+        text = text[:start] + new_text + text[start + old_length:]
+    return text
+
+
+def translate_all(document, pending):
+    """Resolves every pending paragraph; returns the edits in the order they were made."""
+    return [document.set_translation(token, core.upper()) for token, core in pending]
+
+
+def test_split_paragraphs_keeps_blank_lines():
+    assert split_paragraphs('one\n\ntwo\n \nthree') == ['one\n\n', 'two\n \n', 'three']
+    assert ''.join(split_paragraphs('a\n\n\nb\n')) == 'a\n\n\nb\n'
+    assert split_paragraphs('') == []
+
+
+def test_first_update_translates_every_paragraph():
+    document = LiveDocument()
+    edits, pending = document.update('one\n\ntwo')
+    assert [core for _, core in pending] == ['one', 'two']
+    output = apply_edits('', edits)
+    output = apply_edits(output, translate_all(document, pending))
+    assert output == document.text() == 'ONE\n\nTWO'
+
+
+def test_editing_one_paragraph_only_retranslates_that_one():
+    document = LiveDocument()
+    edits, pending = document.update('one\n\ntwo\n\nthree')
+    output = apply_edits(apply_edits('', edits), translate_all(document, pending))
+
+    edits, pending = document.update('one\n\n2\n\nthree')
+    assert [core for _, core in pending] == ['2']
+    output = apply_edits(output, edits)
+    # The old translation stays visible until the new one arrives
+    assert output == 'ONE\n\nTWO\n\nTHREE'
+    output = apply_edits(output, translate_all(document, pending))
+    assert output == document.text() == 'ONE\n\n2\n\nTHREE'
+
+
+def test_inserting_and_removing_paragraphs_keeps_the_layout():
+    document = LiveDocument()
+    edits, pending = document.update('one\n\ntwo')
+    output = apply_edits(apply_edits('', edits), translate_all(document, pending))
+
+    edits, pending = document.update('zero\n\none\n\ntwo')
+    assert [core for _, core in pending] == ['zero']
+    output = apply_edits(apply_edits(output, edits), translate_all(document, pending))
+    assert output == 'ZERO\n\nONE\n\nTWO'
+
+    edits, pending = document.update('zero\n\ntwo')
+    assert pending == []
+    assert apply_edits(output, edits) == document.text() == 'ZERO\n\nTWO'
+
+
+def test_translations_for_removed_paragraphs_are_ignored():
+    document = LiveDocument()
+    _, pending = document.update('one\n\ntwo')
+    token = pending[1][0]
+    document.update('one')
+    assert not document.is_current(token)
+    assert document.set_translation(token, 'TWO') is None
@@ -0,0 +1,68 @@
+from translation_cache import TranslationCache, normalize_text, text_hash
+
+
+def make_cache(tmp_path, **options):
+    return TranslationCache(str(tmp_path / 'cache.db'), **options)
+
+
+def test_normalize_text_collapses_spaces_but_keeps_line_breaks():
+    assert normalize_text('  hello \t  world ') == 'hello world'
+    assert normalize_text('one  line\r\ntwo\tlines\n') == 'one line\ntwo lines'
+    assert text_hash('hello world') == text_hash(' hello   world')
+    assert text_hash('hello world') != text_hash('hello\nworld')
+
+
+def test_lookup_is_keyed_on_normalized_text_and_language_pair(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put('hello   world', 'en', 'fr', 'bonjour le monde')
+    assert cache.get(' hello world ', 'en', 'fr') == 'bonjour le monde'
+    assert cache.get('hello\nworld', 'en', 'fr') is None
+    assert cache.get('hello world', 'en', 'de') is None
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 2
+    cache.close()
+
+
+def test_entries_survive_reopening(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put('cat', 'en', 'fr', 'chat')
+    cache.close()
+    cache = make_cache(tmp_path)
+    assert cache.get('cat', 'en', 'fr') == 'chat'
+    assert cache.stats()['entries'] == 1
+    cache.close()
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    cache = make_cache(tmp_path, max_entries=10)
+    for i in range(10):
+        cache.put(f'text {i}', 'en', 'fr', f'texte {i}')
+    assert cache.get('text 0', 'en', 'fr') == 'texte 0'  # Now the most recently used
+    cache.put('text 10', 'en', 'fr', 'texte 10')
+
+    # Eviction trims to 90% of the limit, oldest access first
+    assert cache.stats()['entries'] == 9
+    assert cache.get('text 0', 'en', 'fr') == 'texte 0'
+    assert cache.get('text 10', 'en', 'fr') == 'texte 10'
+    assert cache.get('text 1', 'en', 'fr') is None
+    assert cache.get('text 2', 'en', 'fr') is None
+    cache.close()
+
+
+def test_put_many_replaces_existing_entries(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put('cat', 'en', 'fr', 'chatte')
+    assert cache.put_many([('cat', 'en', 'fr', 'chat'), ('dog', 'en', 'fr', 'chien')]) == 2
+    assert cache.get('cat', 'en', 'fr') == 'chat'
+    assert cache.get('dog', 'en', 'fr') == 'chien'
+    cache.close()
+
+
+def test_closed_cache_misses_and_ignores_writes(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put('cat', 'en', 'fr', 'chat')
+    cache.close()
+    assert cache.get('cat', 'en', 'fr') is None
+    cache.put('dog', 'en', 'fr', 'chien')
+    assert cache.put_many([('dog', 'en', 'fr', 'chien')]) == 0
+    cache.close()
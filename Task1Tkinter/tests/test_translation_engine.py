@@ -0,0 +1,80 @@
+import threading
+
+from providers import StubProvider, TranslationProvider
+from translation_cache import TranslationCache
+from translation_engine import TranslationEngine
+
+
+class BlockingProvider(TranslationProvider):
+    """Holds every request until release is set, so tests control when work finishes."""
+
+    name = 'blocking'
+
+    def __init__(self):
+        super().__init__(timeout=10.0, retries=0, backoff=0.0, max_backoff=0.0)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def _translate_once(self, text, src_lang, dest_lang):
+        self.calls += 1
+        self.release.wait(5)
+        return f"[{dest_lang}] {text}"
+
+
+def test_identical_requests_in_flight_share_one_provider_call():
+    provider = BlockingProvider()
+    engine = TranslationEngine(provider, batch_text_limit=0)
+    first = engine.submit('hello', 'en', 'fr')
+    second = engine.submit(' hello ', 'en', 'fr')  # Same text once normalized
+    assert engine.in_flight() == 1
+    provider.release.set()
+    assert first.result(timeout=5) == second.result(timeout=5) == '[fr] hello'
+    assert provider.calls == 1
+    engine.close()
+
+
+def test_cancelling_one_caller_leaves_the_others_waiting():
+    provider = BlockingProvider()
+    engine = TranslationEngine(provider, max_workers=1, batch_text_limit=0)
+    engine.submit('busy', 'en', 'fr')  # Occupies the only worker
+    first = engine.submit('hello', 'en', 'fr')
+    second = engine.submit('hello', 'en', 'fr')
+    assert first.cancel()
+    provider.release.set()
+    assert second.result(timeout=5) == '[fr] hello'
+    engine.close()
+
+
+def test_cache_hits_skip_the_provider(tmp_path):
+    provider = StubProvider()
+    engine = TranslationEngine(provider, cache=TranslationCache(str(tmp_path / 'cache.db')),
+                               batch_text_limit=0)
+    assert engine.translate('hello', 'en', 'fr') == '[fr] hello'
+    future = engine.submit('hello', 'en', 'fr')
+    # A hit is answered without going through the pool
+    assert future.done()
+    assert future.result() == '[fr] hello'
+    assert provider.calls == 1
+    engine.close()
+
+
+def test_short_texts_are_batched():
+    provider = StubProvider()
+    engine = TranslationEngine(provider)
+    futures = [engine.submit(f'text {i}', 'en', 'fr') for i in range(5)]
+    assert [f.result(timeout=5) for f in futures] == [f'[fr] text {i}' for i in range(5)]
+    assert engine.metrics()['batched_texts'] == 5
+    assert provider.calls == engine.metrics()['batches_sent']
+    engine.close()
+
+
+def test_results_finishing_after_close_are_dropped(tmp_path):
+    provider = BlockingProvider()
+    cache = TranslationCache(str(tmp_path / 'cache.db'))
+    engine = TranslationEngine(provider, cache=cache, batch_text_limit=0)
+    future = engine.submit('hello', 'en', 'fr')
+    engine.close()
+    provider.release.set()
+    # The worker stores into the closed cache without raising
+    assert future.result(timeout=5) == '[fr] hello'
+    assert cache.get('hello', 'en', 'fr') is None
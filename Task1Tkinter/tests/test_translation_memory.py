@@ -0,0 +1,42 @@
+from translation_memory import TranslationMemory, trigrams
+
+
+def test_trigrams_ignore_case_and_spacing():
+    assert trigrams('Hello  World') == trigrams('hello world')
+
+
+def test_exact_match_scores_one():
+    memory = TranslationMemory()
+    memory.add('Good morning', 'Bonjour', 'en', 'fr')
+    assert memory.lookup('good   MORNING', 'en', 'fr') == [(1.0, 'Good morning', 'Bonjour')]
+
+
+def test_fuzzy_matches_are_ranked_and_thresholded():
+    memory = TranslationMemory()
+    memory.add('The weather is nice today', 'Il fait beau aujourd\'hui', 'en', 'fr')
+    memory.add('The weather is nice', 'Il fait beau', 'en', 'fr')
+    memory.add('Where is the station', 'Où est la gare', 'en', 'fr')
+
+    matches = memory.lookup('The weather is nice today!', 'en', 'fr', threshold=0.6)
+    assert [source for _, source, _ in matches] == ['The weather is nice today', 'The weather is nice']
+    assert matches[0][0] > matches[1][0]
+    assert memory.lookup('Something else entirely', 'en', 'fr') == []
+
+
+def test_lookup_respects_the_language_pair():
+    memory = TranslationMemory()
+    memory.add('Thank you', 'Merci', 'en', 'fr')
+    memory.add('Thank you', 'Danke', 'en', 'de')
+    assert memory.lookup('Thank you', 'en', 'de') == [(1.0, 'Thank you', 'Danke')]
+    assert memory.lookup('Thank you', 'es', 'fr') == []
+    # 'auto' searches every source language
+    assert memory.lookup('Thank you', 'auto', 'fr') == [(1.0, 'Thank you', 'Merci')]
+
+
+def test_later_translation_replaces_earlier_one():
+    memory = TranslationMemory()
+    memory.add('cat', 'chatte', 'en', 'fr')
+    memory.add('Cat', 'chat', 'en', 'fr')
+    memory.add('   ', 'ignored', 'en', 'fr')
+    assert len(memory) == 1
+    assert memory.lookup('cat', 'en', 'fr') == [(1.0, 'Cat', 'chat')]
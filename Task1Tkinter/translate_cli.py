@@ -0,0 +1,149 @@
+"""Headless batch translation.
+
+Translates text files, directories of .txt files and JSONL corpora with the same
+engine (cache, rate limiting, providers) as the Tkinter app, without a display.
+
+    python translate_cli.py --dest fr docs/ corpus.jsonl -o out.jsonl
+    cat corpus.jsonl | python translate_cli.py --dest de --workers 8
+
+JSONL input lines are objects with a "text" field and optional "id", "src" and
+"dest" fields. Output is one JSON object per line, written as each item finishes.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from document_translation import translate_in_chunks
+from providers import create_provider
+from rate_limit import AdaptiveRateLimiter
+from translation_cache import TranslationCache
+from translation_engine import TranslationEngine
+
+
+def iter_jsonl(stream, source_name):
+    """Yields work items from a JSONL stream, one line at a time."""
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        record.setdefault('id', f"{source_name}:{line_number}")
+        yield record
+
+
+def iter_items(paths):
+    """Yields work items from files, directories and JSONL corpora ('-' is stdin)."""
+    for path in paths:
+        if path == '-':
+            yield from iter_jsonl(sys.stdin, 'stdin')
+        elif os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith('.txt'):
+                        yield from iter_items([os.path.join(root, name)])
+        elif path.endswith('.jsonl'):
+            with open(path, 'r', encoding='utf-8') as file:
+                yield from iter_jsonl(file, path)
+        else:
+            with open(path, 'r', encoding='utf-8') as file:
+                yield {'id': path, 'text': file.read()}
+
+
+def translate_item(engine, item, src_lang, dest_lang, chunk_size):
+    """Translates one work item and returns its output record."""
+    src = item.get('src', src_lang)
+    dest = item.get('dest', dest_lang)
+    try:
+        translation = translate_in_chunks(engine.translate, item['text'], src, dest, chunk_size)
+        return {'id': item['id'], 'src': src, 'dest': dest,
+                'source': item['text'], 'translation': translation}
+    except Exception as e:
+        return {'id': item['id'], 'src': src, 'dest': dest, 'error': str(e)}
+
+
+def run(engine, items, output, src_lang, dest_lang, workers=4, chunk_size=4000):
+    """Translates items on `workers` threads, writing each result as it completes.
+
+    Only a bounded window of items is in flight, so input is read as a stream.
+    Returns (translated, failed) counts.
+    """
+    translated = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        items = iter(items)
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < workers * 2:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(
+                    translate_item, engine, item, src_lang, dest_lang, chunk_size))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                if 'error' in record:
+                    failed += 1
+                else:
+                    translated += 1
+                output.write(json.dumps(record, ensure_ascii=False) + '\n')
+                output.flush()
+    return translated, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-translate files and JSONL corpora.")
+    parser.add_argument('inputs', nargs='*', default=['-'],
+                        help="text files, directories of .txt files, .jsonl files, or '-' for stdin")
+    parser.add_argument('--src', default='auto', help="source language code (default: auto)")
+    parser.add_argument('--dest', required=True, help="target language code")
+    parser.add_argument('-o', '--output', help="output JSONL file (default: stdout)")
+    parser.add_argument('--workers', type=int, default=4, help="concurrent requests")
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help="maximum requests per second (0 disables the limit)")
+    parser.add_argument('--provider', default='google', help="translation provider (google or stub)")
+    parser.add_argument('--cache', default='translations.db', help="SQLite cache database")
+    parser.add_argument('--no-cache', action='store_true', help="disable the translation cache")
+    parser.add_argument('--chunk-size', type=int, default=4000,
+                        help="maximum characters per request for long texts")
+    args = parser.parse_args(argv)
+
+    engine = TranslationEngine(
+        create_provider(args.provider),
+        None if args.no_cache else TranslationCache(args.cache),
+        AdaptiveRateLimiter(args.rate, max_concurrency=args.workers) if args.rate > 0 else None)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    started = time.perf_counter()
+    try:
+        translated, failed = run(engine, iter_items(args.inputs), output,
+                                 args.src, args.dest, args.workers, args.chunk_size)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        engine.close()
+    elapsed = time.perf_counter() - started
+
+    total = translated + failed
+    print(f"{total} items ({failed} failed) in {elapsed:.2f}s: "
+          f"{total / elapsed if elapsed else 0:.1f} items/s", file=sys.stderr)
+    if engine.cache is not None:
+        stats = engine.cache.stats()
+        print(f"cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.0%} hit rate)", file=sys.stderr)
+    if engine.rate_limiter is not None:
+        metrics = engine.rate_limiter.metrics()
+        print(f"rate limiter: {metrics['rate']:.1f} req/s, concurrency {metrics['concurrency_limit']}, "
+              f"{metrics['errors']} errors, {metrics['rejected']} rejected", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
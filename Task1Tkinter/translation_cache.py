@@ -0,0 +1,216 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_text(text):
+    """Normalizes text so trivially different inputs share one cache entry.
+
+    Runs of spaces and tabs collapse to one space and the ends are trimmed, but
+    line breaks are kept: texts that differ in layout translate differently.
+    """
+    text = unicodedata.normalize('NFC', text).replace('\r\n', '\n')
+    return '\n'.join(' '.join(line.split()) for line in text.strip().split('\n'))
+
+
+def text_hash(text):
+    """Returns the content hash used as the cache key for a piece of text."""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """Persistent translation cache stored in the app's SQLite database.
+
+    Entries are keyed on (normalized text hash, source language, target language).
+    A small in-memory LRU sits in front of the database so repeated phrases are
+    answered without touching the disk, and the table is trimmed by age and size.
+    Once closed, lookups miss and writes are dropped, so a worker that finishes
+    after shutdown cannot fail on the closed database.
+    """
+
+    def __init__(self, db_path='translations.db', max_entries=50000,
+                 max_age=30 * 24 * 3600, memory_entries=1000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self.closed = False
+
+        self.__lock = threading.RLock()
+        self.__memory = OrderedDict()
+        self.__pending_touches = {}  # key -> last access time, flushed in batches
+        self.__conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.__conn.execute("PRAGMA synchronous=NORMAL")
+        self.__conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_cache (
+                text_hash TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (text_hash, source_lang, target_lang)
+            )""")
+        self.__conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translation_cache_access "
+            "ON translation_cache (last_access)")
+        self.__conn.commit()
+        self.purge_expired()
+        self.__count = self.__conn.execute(
+            "SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+
+    def get(self, text, src_lang, dest_lang):
+        """Returns the cached translation, or None on a miss."""
+        key = (text_hash(text), src_lang, dest_lang)
+        now = time.time()
+        with self.__lock:
+            if self.closed:
+                return None
+            entry = self.__memory.get(key)
+            if entry is not None:
+                translated_text, created_at = entry
+                if now - created_at <= self.max_age:
+                    self.__memory.move_to_end(key)
+                    self.__pending_touches[key] = now
+                    self.hits += 1
+                    return translated_text
+                del self.__memory[key]
+
+            row = self.__conn.execute(
+                "SELECT translated_text, created_at FROM translation_cache "
+                "WHERE text_hash = ? AND source_lang = ? AND target_lang = ?", key).fetchone()
+            if row is None or now - row[1] > self.max_age:
+                self.misses += 1
+                return None
+
+            self.__remember(key, row[0], row[1])
+            self.__pending_touches[key] = now
+            if len(self.__pending_touches) >= 100:
+                self.__flush_touches()
+            self.hits += 1
+            return row[0]
+
+    def put(self, text, src_lang, dest_lang, translated_text):
+        """Stores a translation and evicts old entries if the cache is full."""
+        key = (text_hash(text), src_lang, dest_lang)
+        now = time.time()
+        with self.__lock:
+            if self.closed:
+                return
+            self.__remember(key, translated_text, now)
+            self.__pending_touches.pop(key, None)
+            cursor = self.__conn.execute(
+                "INSERT OR IGNORE INTO translation_cache VALUES (?, ?, ?, ?, ?, ?)",
+                key + (translated_text, now, now))
+            if cursor.rowcount:
+                self.__count += 1
+            else:
+                self.__conn.execute(
+                    "UPDATE translation_cache SET translated_text = ?, created_at = ?, last_access = ? "
+                    "WHERE text_hash = ? AND source_lang = ? AND target_lang = ?",
+                    (translated_text, now, now) + key)
+            if self.__count > self.max_entries:
+                self.__evict()
+            self.__flush_touches()
+
+    def put_many(self, entries):
+        """Stores many (text, src_lang, dest_lang, translated_text) entries in one transaction.
+
+        Existing entries are replaced. Used to pre-fill the cache from a translation memory.
+        """
+        now = time.time()
+        rows = [(text_hash(text), src_lang, dest_lang, translated_text, now, now)
+                for text, src_lang, dest_lang, translated_text in entries]
+        with self.__lock:
+            if self.closed:
+                return 0
+            self.__conn.executemany(
+                "INSERT OR REPLACE INTO translation_cache VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.__conn.commit()
+            self.__memory.clear()
+            # Upper bound (replaced rows are counted twice); __evict recounts exactly
+            self.__count += len(rows)
+            if self.__count > self.max_entries:
+                self.__evict()
+        return len(rows)
+
+    def purge_expired(self):
+        """Deletes entries older than max_age."""
+        with self.__lock:
+            cutoff = time.time() - self.max_age
+            self.__conn.execute(
+                "DELETE FROM translation_cache WHERE created_at < ?", (cutoff,))
+            self.__conn.commit()
+            for key in [k for k, v in self.__memory.items() if v[1] < cutoff]:
+                del self.__memory[key]
+
+    def clear(self):
+        """Removes every cached translation and resets the counters."""
+        with self.__lock:
+            self.__conn.execute("DELETE FROM translation_cache")
+            self.__conn.commit()
+            self.__memory.clear()
+            self.__pending_touches.clear()
+            self.__count = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Returns the hit/miss counters and current size."""
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': self.__count,
+            }
+
+    def close(self):
+        """Writes pending access times and closes the database."""
+        with self.__lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.__flush_touches()
+            self.__conn.close()
+
+    def __remember(self, key, translated_text, created_at):
+        """Adds an entry to the in-memory LRU (private method)."""
+        self.__memory[key] = (translated_text, created_at)
+        self.__memory.move_to_end(key)
+        while len(self.__memory) > self.memory_entries:
+            self.__memory.popitem(last=False)
+
+    def __flush_touches(self):
+        """Persists batched last-access updates in one transaction (private method)."""
+        if self.__pending_touches:
+            self.__conn.executemany(
+                "UPDATE translation_cache SET last_access = ? "
+                "WHERE text_hash = ? AND source_lang = ? AND target_lang = ?",
+                [(when,) + key for key, when in self.__pending_touches.items()])
+            self.__pending_touches.clear()
+        self.__conn.commit()
+
+    def __evict(self):
+        """Drops expired entries, then the least recently used ones (private method)."""
+        self.__flush_touches()
+        self.__conn.execute(
+            "DELETE FROM translation_cache WHERE created_at < ?", (time.time() - self.max_age,))
+        # Evict a little below the limit so we don't evict on every insert
+        target = int(self.max_entries * 0.9)
+        self.__conn.execute("""
+            DELETE FROM translation_cache WHERE rowid IN (
+                SELECT rowid FROM translation_cache
+                ORDER BY last_access ASC
+                LIMIT max(0, (SELECT COUNT(*) FROM translation_cache) - ?)
+            )""", (target,))
+        self.__conn.commit()
+        self.__count = self.__conn.execute(
+            "SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+        self.__memory.clear()
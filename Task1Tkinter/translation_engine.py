@@ -0,0 +1,179 @@
+import contextlib
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+
+from batching import TranslationBatcher
+from providers import BatchNotSupported
+from translation_cache import text_hash
+
+
+class TranslationEngine:
+    """UI-independent translation core: cache lookup, rate limiting, then the provider.
+
+    Both the Tkinter app and the command-line tool translate through this class,
+    so they share the same cache and throttling behaviour. Asynchronous requests
+    run on one bounded thread pool, and identical requests already in flight are
+    coalesced into a single provider call. Cache hits are answered right away;
+    missed texts of at most `batch_text_limit` characters are packed together
+    into batch requests (0 disables batching).
+    Provider calls are timed as 'provider' spans when `instrumentation` is given.
+    """
+
+    def __init__(self, provider, cache=None, rate_limiter=None, max_workers=4,
+                 batch_text_limit=500, instrumentation=None):
+        self.provider = provider
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation
+        self.batch_text_limit = batch_text_limit
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='translate')
+        self.batcher = TranslationBatcher(self.__translate_batch) if batch_text_limit else None
+        self.__in_flight = {}  # (text hash, src, dest) -> [shared future, waiter count]
+        self.__lock = threading.RLock()
+
+    def translate(self, text, src_lang, dest_lang):
+        """Translates text, answering repeated text from the cache."""
+        cached = self.__cached(text, src_lang, dest_lang)
+        if cached is not None:
+            return cached
+        if self.__batchable(text):
+            return self.batcher.translate(text, src_lang, dest_lang)
+        return self.__translate_uncached(text, src_lang, dest_lang)
+
+    def submit(self, text, src_lang, dest_lang):
+        """Translates text on the shared pool and returns a Future for the result.
+
+        Each caller gets its own Future, so cancelling one never affects other
+        callers waiting on the same text; the underlying request is only cancelled
+        once every caller has given up on it. A cache hit returns a Future that is
+        already resolved.
+        """
+        future = Future()
+        cached = self.__cached(text, src_lang, dest_lang)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+
+        key = (text_hash(text), src_lang, dest_lang)
+        with self.__lock:
+            entry = self.__in_flight.get(key)
+            if entry is None:
+                if self.__batchable(text):
+                    # Short texts wait in the batcher instead of occupying a worker
+                    shared = self.batcher.submit(text, src_lang, dest_lang)
+                else:
+                    shared = self.executor.submit(self.__translate_uncached, text, src_lang, dest_lang)
+                entry = [shared, 0]
+                self.__in_flight[key] = entry
+                shared.add_done_callback(lambda f: self.__forget(key, entry))
+            entry[1] += 1
+
+        def relay(shared):
+            try:
+                if shared.cancelled():
+                    future.cancel()
+                elif shared.exception() is not None:
+                    future.set_exception(shared.exception())
+                else:
+                    future.set_result(shared.result())
+            except InvalidStateError:
+                pass  # The caller cancelled first
+
+        def release(own):
+            if own.cancelled():
+                self.__release(key, entry)
+
+        future.add_done_callback(release)
+        entry[0].add_done_callback(relay)
+        return future
+
+    def in_flight(self):
+        """Returns the number of distinct requests currently queued or running."""
+        with self.__lock:
+            return len(self.__in_flight)
+
+    def metrics(self):
+        """Returns in-flight request counts plus rate limiter metrics, if any."""
+        metrics = {'distinct_in_flight': self.in_flight()}
+        if self.batcher is not None:
+            metrics['batches_sent'] = self.batcher.batches_sent
+            metrics['batched_texts'] = self.batcher.items_sent
+        if self.rate_limiter is not None and hasattr(self.rate_limiter, 'metrics'):
+            metrics.update(self.rate_limiter.metrics())
+        return metrics
+
+    def close(self):
+        """Stops the worker pool and closes the cache and provider."""
+        if self.batcher is not None:
+            self.batcher.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.cache is not None:
+            self.cache.close()
+        self.provider.close()
+
+    def __batchable(self, text):
+        return self.batcher is not None and len(text) <= self.batch_text_limit
+
+    def __cached(self, text, src_lang, dest_lang):
+        return None if self.cache is None else self.cache.get(text, src_lang, dest_lang)
+
+    def __translate_uncached(self, text, src_lang, dest_lang):
+        """Translates a cache miss and stores the result (private method)."""
+        translated_text = self.__call_provider(self.provider.translate, text, src_lang, dest_lang)
+        if self.cache is not None:
+            self.cache.put(text, src_lang, dest_lang, translated_text)
+        return translated_text
+
+    def __translate_batch(self, texts, src_lang, dest_lang):
+        """Translates a batch of cache misses and stores the results (private method)."""
+        try:
+            translations = self.__call_provider(self.provider.translate_batch, texts, src_lang, dest_lang)
+        except BatchNotSupported:
+            # One request per text, each taking its own rate limiter token
+            translations = [self.__call_provider(self.provider.translate, text, src_lang, dest_lang)
+                            for text in texts]
+        if self.cache is not None:
+            for text, translated_text in zip(texts, translations):
+                self.cache.put(text, src_lang, dest_lang, translated_text)
+        return translations
+
+    def __call_provider(self, function, payload, src_lang, dest_lang):
+        """Calls the provider under the rate limiter, reporting the outcome (private method)."""
+        texts = len(payload) if isinstance(payload, list) else 1
+        if self.rate_limiter is None:
+            with self.__span('provider', texts=texts, src=src_lang, dest=dest_lang):
+                return function(payload, src_lang, dest_lang)
+        self.rate_limiter.acquire()
+        started = time.perf_counter()
+        ok = False
+        try:
+            with self.__span('provider', texts=texts, src=src_lang, dest=dest_lang):
+                result = function(payload, src_lang, dest_lang)
+            ok = True
+            return result
+        except BatchNotSupported:
+            ok = True  # The provider is healthy; the batch just has to go out text by text
+            raise
+        finally:
+            self.rate_limiter.release(ok, time.perf_counter() - started)
+
+    def __span(self, name, **fields):
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.span(name, **fields)
+
+    def __forget(self, key, entry):
+        """Drops a finished request so later lookups go through the cache (private method)."""
+        with self.__lock:
+            if self.__in_flight.get(key) is entry:
+                del self.__in_flight[key]
+
+    def __release(self, key, entry):
+        """Cancels a request once no caller is waiting for it (private method)."""
+        with self.__lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                # Only succeeds if the request has not started running yet
+                entry[0].cancel()
+
@@ -0,0 +1,96 @@
+import math
+import threading
+from collections import defaultdict
+
+
+def _normalize(text):
+    return ' '.join(text.lower().split())
+
+
+def trigrams(text):
+    """Returns the set of character trigrams of normalized, space-padded text."""
+    padded = f"  {_normalize(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TranslationMemory:
+    """In-memory translation memory with exact and fuzzy (trigram) lookup.
+
+    Each language pair has an inverted index from trigram to entry ids. A fuzzy
+    lookup only walks the postings of the query's rarest trigrams (any entry that
+    can reach the threshold must share one of them), then scores candidates with
+    the Dice coefficient, so suggestions come back in well under a millisecond.
+    Entries are added incrementally as new translations are made.
+    """
+
+    def __init__(self):
+        self.__entries = []  # entry id -> (source, target, trigram set)
+        self.__exact = {}  # (src, dest, normalized source) -> entry id
+        self.__index = defaultdict(lambda: defaultdict(list))  # (src, dest) -> trigram -> ids
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def add(self, source, target, src_lang, dest_lang):
+        """Adds a translated pair; a later translation of the same text replaces the earlier one."""
+        if not source.strip() or not target.strip():
+            return
+        grams = trigrams(source)
+        with self.__lock:
+            key = (src_lang, dest_lang, _normalize(source))
+            if key in self.__exact:
+                entry_id = self.__exact[key]
+                self.__entries[entry_id] = (source, target, self.__entries[entry_id][2])
+                return
+            entry_id = len(self.__entries)
+            self.__entries.append((source, target, frozenset(grams)))
+            self.__exact[key] = entry_id
+            postings = self.__index[(src_lang, dest_lang)]
+            for gram in grams:
+                postings[gram].append(entry_id)
+
+    def lookup(self, text, src_lang, dest_lang, threshold=0.75, limit=3):
+        """Returns up to `limit` (score, source, target) matches, best first.
+
+        An exact match (ignoring case and spacing) scores 1.0. src_lang 'auto'
+        searches every source language for the target language.
+        """
+        normalized = _normalize(text)
+        if not normalized:
+            return []
+        grams = trigrams(text)
+        size = len(grams)
+        # Dice >= threshold bounds the candidate's trigram count from both sides,
+        # and means it shares at least `required` trigrams with the query
+        min_size = size * threshold / (2 - threshold)
+        max_size = size * (2 - threshold) / threshold
+        required = max(1, math.ceil(threshold * (size + min_size) / 2))
+        with self.__lock:
+            pairs = [pair for pair in self.__index
+                     if pair[1] == dest_lang and (src_lang == 'auto' or pair[0] == src_lang)]
+            matches = {}
+            for pair in pairs:
+                exact_id = self.__exact.get((pair[0], pair[1], normalized))
+                if exact_id is not None:
+                    matches[exact_id] = 1.0
+                postings = self.__index[pair]
+                rarest = sorted(grams, key=lambda gram: len(postings.get(gram, ())))
+                # A match shares `required` trigrams with the query, so it shares at
+                # least `hits` of the rarest size - required + hits of them
+                hits = min(2, required)
+                seen = defaultdict(int)
+                for gram in rarest[:size - required + hits]:
+                    for entry_id in postings.get(gram, ()):
+                        seen[entry_id] += 1
+                for entry_id, count in seen.items():
+                    if count < hits or entry_id in matches:
+                        continue
+                    candidate_grams = self.__entries[entry_id][2]
+                    if not min_size <= len(candidate_grams) <= max_size:
+                        continue
+                    score = 2 * len(grams & candidate_grams) / (size + len(candidate_grams))
+                    if score >= threshold:
+                        matches[entry_id] = score
+            best = sorted(matches.items(), key=lambda item: item[1], reverse=True)[:limit]
+            return [(score, self.__entries[i][0], self.__entries[i][1]) for i, score in best]
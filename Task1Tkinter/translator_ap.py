@@ -1,16 +1,46 @@
+import time
+_STARTED = time.perf_counter()  # Measured before any other import so startup regressions show up
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
-import threading
 import os
+import threading
 import webbrowser
-import pyttsx3
-from PIL import Image, ImageTk
-from googletrans import Translator
-from gtts import gTTS
-from playsound import playsound
-import tempfile
+from translation_cache import TranslationCache
+from providers import create_provider
+from translation_engine import TranslationEngine
+from rate_limit import AdaptiveRateLimiter
+from ui_dispatcher import UIDispatcher
+from live_translate import LiveDocument
+from history_store import HistoryStore
+from document_translation import DocumentTranslation
+from speech import SpeechWorker
+from export import EXPORTERS, export_tmx, import_tmx
+from translation_memory import TranslationMemory
+from language_detect import detect_language
+from instrumentation import Instrumentation
+
+_IMPORTED = time.perf_counter()
+
+# Button icons are resized once and kept here, so later launches skip PIL entirely
+ICON_SIZE = (24, 24)
+ICON_CACHE_DIR = os.path.join('icons', 'cache')
+# Texts longer than this are translated in document mode (chunked and in parallel)
+DOCUMENT_CHUNK_SIZE = 4000
+# Maximum number of translation requests running at once
+TRANSLATION_WORKERS = 4
+# Requests per second sent to the translation service, and how long a request may queue
+TRANSLATION_RATE = 5.0
+TRANSLATION_MAX_WAIT = 60.0
+# Rows loaded at a time into the history/favorites tables
+RECORDS_PAGE_SIZE = 200
+# Live mode waits this long after the last keystroke before translating
+LIVE_DEBOUNCE_MS = 600
+# Timing spans are appended to this file as JSON lines; cProfile captures go to the .prof file
+LOG_PATH = 'app.log'
+PROFILE_PATH = 'translator.prof'
 
 # multiple inheritance: Create a Mixin class for utility methods
 
@@ -48,14 +78,52 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         self.resizable(True, True)
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-        # Encapsulation example: engine, voices, history, and favorites are private properties
-        self.__engine = pyttsx3.init()
-        self.__voices = self.__engine.getProperty('voices')
+        # Encapsulation example: speech, history, and favorites are private properties
+        self.instrumentation = Instrumentation(LOG_PATH)
         self.__load_icons()
         self.__setup_ui()
-        self.__history = []  # Private (Encapsulated) history
-        self.__favorites = []  # Private (Encapsulated) favorites
-        self.translator = Translator()
+        # Private (Encapsulated) history and favorites, persisted in translations.db
+        self.__store = HistoryStore('translations.db')
+        # Fuzzy-match index over past translations, filled from the store in the background
+        self.__memory = TranslationMemory()
+        self.__closing = threading.Event()  # Tells background readers of the store to stop
+        self.__memory_loader = threading.Thread(target=self.__load_translation_memory, daemon=True)
+        self.__memory_loader.start()
+        # One shared engine for every translation; TRANSLATOR_PROVIDER=stub runs offline
+        self.engine = TranslationEngine(
+            create_provider(os.environ.get('TRANSLATOR_PROVIDER', 'google'), timeout=10.0),
+            TranslationCache('translations.db'),
+            AdaptiveRateLimiter(TRANSLATION_RATE, max_concurrency=TRANSLATION_WORKERS,
+                                max_wait=TRANSLATION_MAX_WAIT),
+            max_workers=TRANSLATION_WORKERS, instrumentation=self.instrumentation)
+        self.__document_job = None  # Running DocumentTranslation, if any
+        self.__pending_translation = None  # Future of the latest Translate click
+        # Live mode state: paragraph/translation alignment, debounce timer, in-flight paragraphs
+        self.__live_document = LiveDocument()
+        self.__live_after_id = None
+        self.__live_futures = {}
+        # Worker threads never touch widgets directly; they post updates here
+        self.dispatcher = UIDispatcher(self, instrumentation=self.instrumentation)
+        self.dispatcher.start()
+        # One speech thread owns the TTS engine and speaks requests in order
+        self.__speech = SpeechWorker(
+            cache_dir='tts_cache',
+            on_voices=lambda names: self.dispatcher.post(self.__set_voices, names),
+            on_error=lambda e: self.dispatcher.post(
+                messagebox.showerror, "Text-to-Speech Error", str(e)),
+            instrumentation=self.instrumentation)
+        self.__speech.start()
+
+        # Startup timing: imports, window built, and first paint (idle tasks run after drawing)
+        self.startup_times = {'imports': _IMPORTED - _STARTED,
+                              'window_ready': time.perf_counter() - _STARTED}
+        self.after_idle(self.__report_startup)
+
+    def __report_startup(self):
+        """Logs how long it took until the window was first drawn, stage by stage, to app.log."""
+        self.startup_times['first_paint'] = time.perf_counter() - _STARTED
+        self.instrumentation.record('startup', self.startup_times['first_paint'], **{
+            stage: round(seconds * 1000, 1) for stage, seconds in self.startup_times.items()})
 
     def __load_icons(self):
         """Loads icons for the buttons (private method)."""
@@ -64,13 +132,23 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
                       'share', 'open_file', 'exit', 'about', 'favorite']
         for name in icon_names:
             try:
-                image = Image.open(f'icons/{name}.png').resize((24, 24))
-                self.icons[name] = ImageTk.PhotoImage(image)
+                self.icons[name] = tk.PhotoImage(file=self.__resized_icon(name))
             except FileNotFoundError:
                 # Use a default or empty image if the icon is not found
                 self.icons[name] = None
                 print(f"Icon not found: {name}.png")
 
+    @staticmethod
+    def __resized_icon(name):
+        """Returns the path of the resized icon, creating it on the first launch."""
+        source = f'icons/{name}.png'
+        cached = os.path.join(ICON_CACHE_DIR, f'{name}_{ICON_SIZE[0]}x{ICON_SIZE[1]}.png')
+        if not os.path.exists(cached) or os.path.getmtime(cached) < os.path.getmtime(source):
+            from PIL import Image  # Only needed when the cache is cold
+            os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+            Image.open(source).resize(ICON_SIZE).save(cached)
+        return cached
+
     def __setup_ui(self):
         """Sets up the UI components (comboboxes, text areas, buttons)."""
         self.languages = {
@@ -102,6 +180,9 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
                                             values=list(self.languages.keys()), state='readonly', width=30)
         self.source_lang_cb.grid(
             row=0, column=0, padx=10, pady=10, sticky='ew')
+        self.source_lang_cb.bind('<<ComboboxSelected>>', self.__on_language_changed)
+        # Names by code, for reporting the language Auto-Detect found
+        self.__language_names = {code: name for name, code in self.languages.items()}
 
         # Target Language Combobox
         self.target_lang_var = tk.StringVar(value='English')
@@ -109,11 +190,13 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
                                             values=list(self.languages.keys())[1:], state='readonly', width=30)
         self.target_lang_cb.grid(
             row=0, column=1, padx=10, pady=10, sticky='ew')
+        self.target_lang_cb.bind('<<ComboboxSelected>>', self.__on_language_changed)
 
         # Source Text
         self.source_text = tk.Text(
             self, height=15, wrap=WORD, font=('Helvetica', 12))
         self.source_text.grid(row=1, column=0, padx=10, pady=10, sticky='nsew')
+        self.source_text.bind('<<Modified>>', self.__on_source_modified)
 
         # Translated Text
         self.translated_text = tk.Text(
@@ -178,6 +261,49 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         self.create_tooltip(self.favorite_btn,
                             "Add the translation to favorites")
 
+        # Live translation toggle
+        self.live_var = tk.BooleanVar(value=False)
+        self.live_toggle = ttkb.Checkbutton(
+            self.button_frame, text="Live", variable=self.live_var,
+            command=self.toggle_live_mode, bootstyle="round-toggle")
+        self.live_toggle.grid(row=0, column=7, padx=5)
+        self.create_tooltip(self.live_toggle, "Translate as you type")
+
+        # Voice selector, filled in when the speech engine is ready
+        self.voice_var = tk.StringVar()
+        self.voice_cb = ttkb.Combobox(
+            self.button_frame, textvariable=self.voice_var, state='readonly', width=20)
+        self.voice_cb.grid(row=0, column=8, padx=5)
+        self.create_tooltip(self.voice_cb, "Voice used for text-to-speech")
+
+        # Language found by Auto-Detect; the combobox itself stays on Auto-Detect
+        self.detected_lang_var = tk.StringVar(value='')
+        self.detected_lang_label = ttkb.Label(
+            self.button_frame, textvariable=self.detected_lang_var, bootstyle="secondary")
+        self.detected_lang_label.grid(row=0, column=9, padx=5)
+
+        # Document progress and cancel (only shown while a document is translating)
+        self.progress_var = tk.DoubleVar(value=0)
+        self.progress_bar = ttkb.Progressbar(
+            self.button_frame, variable=self.progress_var, maximum=100, bootstyle="info-striped")
+        self.progress_bar.grid(row=1, column=0, columnspan=6, padx=5, pady=(10, 0), sticky='ew')
+        self.cancel_btn = ttkb.Button(
+            self.button_frame, text="Cancel", command=self.cancel_document_translation,
+            bootstyle="danger-outline")
+        self.cancel_btn.grid(row=1, column=6, padx=5, pady=(10, 0))
+        self.progress_bar.grid_remove()
+        self.cancel_btn.grid_remove()
+
+        # Translation memory suggestions (only shown when there are matches)
+        self.__suggestions = []
+        self.suggestion_frame = ttkb.Labelframe(
+            self, text="Translation Memory (double-click to use)", bootstyle="info")
+        self.suggestion_frame.grid(row=3, column=0, columnspan=2, padx=10, pady=(0, 10), sticky='ew')
+        self.suggestion_list = tk.Listbox(self.suggestion_frame, height=3, font=('Helvetica', 11))
+        self.suggestion_list.pack(fill=X, padx=5, pady=5)
+        self.suggestion_list.bind('<Double-Button-1>', self.__use_suggestion)
+        self.suggestion_frame.grid_remove()
+
         # Menu Bar
         self.menu_bar = tk.Menu(self)
         self.config(menu=self.menu_bar)
@@ -188,6 +314,15 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         icon_open_file = self.icons.get('open_file')
         file_menu.add_command(
             label="Open File", command=self.upload_file, image=icon_open_file, compound=LEFT)
+        file_menu.add_command(
+            label="Translate Document...", command=self.translate_document)
+        file_menu.add_separator()
+        file_menu.add_command(
+            label="Export History...", command=self.export_history)
+        file_menu.add_command(
+            label="Export Favorites...", command=self.export_favorites)
+        file_menu.add_command(
+            label="Import Translation Memory...", command=self.import_translation_memory)
         file_menu.add_separator()
         icon_exit = self.icons.get('exit')
         file_menu.add_command(
@@ -213,57 +348,314 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         help_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="Help", menu=help_menu)
         icon_about = self.icons.get('about')
+        help_menu.add_command(
+            label="Diagnostics", command=self.show_diagnostics)
         help_menu.add_command(
             label="About", command=self.show_about, image=icon_about, compound=LEFT)
 
     # Overriding the method to change its behavior
     def translate_text(self):
         """Translates text from source to target language."""
-        src_lang = self.languages[self.source_lang_var.get()]
-        dest_lang = self.languages[self.target_lang_var.get()]
-        text = self.source_text.get("1.0", tk.END).strip()
+        started = time.perf_counter()
+        with self.instrumentation.span('translate_text.read'):
+            src_lang = self.languages[self.source_lang_var.get()]
+            dest_lang = self.languages[self.target_lang_var.get()]
+            text = self.source_text.get("1.0", tk.END).strip()
         if not text:
             messagebox.showwarning(
                 "Input Error", "Please enter text to translate.")
             return
 
+        # Identify the source language locally so the request carries a concrete code
+        if src_lang == 'auto':
+            with self.instrumentation.span('translate_text.detect', chars=len(text)):
+                src_lang = self.__detect_source_language(text)
+        source_lang_name = self.__language_names[src_lang]
+
+        # Offer near-identical past translations right away, before any network call
+        with self.instrumentation.span('translate_text.suggest'):
+            self.__show_suggestions(text, src_lang, dest_lang)
+
+        # In live mode the output is managed paragraph by paragraph
+        if self.live_var.get():
+            self.__reset_live_mode()
+            self.__live_translate()
+            return
+
         # Disable the translate button to prevent multiple clicks
         self.translate_btn.config(state=DISABLED)
 
-        # Use threading to prevent the GUI from freezing
-        threading.Thread(target=self.__translate_thread,
-                         args=(text, src_lang, dest_lang)).start()
+        # Large texts go through document mode instead of one huge request
+        if len(text) > DOCUMENT_CHUNK_SIZE:
+            self.__start_document_translation(text, src_lang, dest_lang, source_lang_name)
+            return
 
-    def __translate_thread(self, text, src_lang, dest_lang):
-        """Handles translation in a separate thread (Encapsulated)."""
-        try:
-            # Call the translation API
-            translated_text = self.call_translation_api(
-                text, src_lang, dest_lang)
+        # Translate on the shared worker pool to prevent the GUI from freezing
+        self.source_text.edit_modified(False)
+        submitted = time.perf_counter()
+        future = self.engine.submit(text, src_lang, dest_lang)
+        self.__pending_translation = future
+
+        def finished(f):
+            # Worker side: queueing, cache and network time of this request
+            self.instrumentation.record('translate.request', time.perf_counter() - submitted,
+                                        chars=len(text), cancelled=f.cancelled())
+            self.dispatcher.post(self.__on_translation_done, f, text, source_lang_name, started)
+
+        future.add_done_callback(finished)
+
+    def __detect_source_language(self, text):
+        """Detects the language of text for this request only; returns its code or 'auto'.
+
+        The source combobox stays on Auto-Detect so the next request is detected
+        again; the result is only shown next to the buttons.
+        """
+        detected = detect_language(text)
+        if detected in self.__language_names and detected != 'auto':
+            self.detected_lang_var.set(f"Detected: {self.__language_names[detected]}")
+            return detected
+        self.detected_lang_var.set('')
+        return 'auto'  # Too short or ambiguous: let the translation service decide
+
+    def translate_document(self):
+        """Opens a text file and translates it in document mode."""
+        if self.upload_file():
+            self.translate_text()
+
+    def __start_document_translation(self, text, src_lang, dest_lang, source_lang_name):
+        """Translates a large text in chunks, streaming each chunk into the output."""
+        self.translated_text.delete("1.0", tk.END)
+        self.progress_var.set(0)
+        self.progress_bar.grid()
+        self.cancel_btn.grid()
+        target_lang_name = self.target_lang_var.get()
+        started = time.perf_counter()
+
+        # These run on the main loop via the dispatcher; updates from a job that
+        # has since been cancelled are ignored
+        def show_chunk(job, translated_chunk):
+            if self.__document_job is job:
+                self.translated_text.insert(tk.END, translated_chunk)
+
+        def show_progress(job, done, total):
+            if self.__document_job is job:
+                self.progress_var.set(100 * done / total)
+
+        def finish(job):
+            if self.__document_job is job:
+                self.__finish_document_translation()
+                self.instrumentation.record('translate_document', time.perf_counter() - started,
+                                            chars=len(text))
+                self.__save_history({
+                    'source_text': text,
+                    'translated_text': self.translated_text.get("1.0", tk.END).strip(),
+                    'source_lang': source_lang_name,
+                    'target_lang': target_lang_name
+                })
+
+        def fail(job, e):
+            if self.__document_job is job:
+                self.__finish_document_translation()
+                messagebox.showerror("Translation Error", str(e))
+
+        post = self.dispatcher.post
+        job = DocumentTranslation(
+            self.call_translation_api, text, src_lang, dest_lang,
+            chunk_size=DOCUMENT_CHUNK_SIZE, executor=self.engine.executor,
+            on_chunk=lambda index, chunk: post(show_chunk, job, chunk),
+            on_progress=lambda done, total: post(show_progress, job, done, total, key='progress'),
+            on_done=lambda: post(finish, job),
+            on_error=lambda e: post(fail, job, e))
+        self.source_text.edit_modified(False)
+        self.__document_job = job
+        job.start()
+
+    def cancel_document_translation(self):
+        """Cancels the running document translation, keeping what is already shown."""
+        if self.__document_job is not None:
+            self.__document_job.cancel()
+            self.__finish_document_translation()
+
+    def __finish_document_translation(self):
+        """Hides the progress widgets and re-enables translating."""
+        self.__document_job = None
+        self.progress_bar.grid_remove()
+        self.cancel_btn.grid_remove()
+        self.translate_btn.config(state=NORMAL)
+
+    def __on_source_modified(self, event):
+        """Cancels in-flight translations once the source text they were made from changes."""
+        if not self.source_text.edit_modified():
+            return
+        self.source_text.edit_modified(False)
+        if self.__pending_translation is not None:
+            self.__pending_translation.cancel()
+            self.__pending_translation = None
+            self.translate_btn.config(state=NORMAL)
+        self.cancel_document_translation()
+        if self.live_var.get():
+            # Debounce: restart the timer on every edit
+            if self.__live_after_id is not None:
+                self.after_cancel(self.__live_after_id)
+            self.__live_after_id = self.after(LIVE_DEBOUNCE_MS, self.__live_translate)
+
+    def __on_language_changed(self, event):
+        """Re-translates everything in live mode when the language pair changes."""
+        if self.languages[self.source_lang_var.get()] != 'auto':
+            self.detected_lang_var.set('')
+        if self.live_var.get():
+            self.__reset_live_mode()
+            self.__live_translate()
+
+    def toggle_live_mode(self):
+        """Turns translate-as-you-type on or off."""
+        self.__reset_live_mode()
+        if self.live_var.get():
+            self.__live_translate()
+
+    def __reset_live_mode(self):
+        """Cancels live work in progress and starts the next live pass from scratch."""
+        if self.__live_after_id is not None:
+            self.after_cancel(self.__live_after_id)
+            self.__live_after_id = None
+        for future in self.__live_futures.values():
+            future.cancel()
+        self.__live_futures.clear()
+        self.__live_document.reset()
+        self.translated_text.delete("1.0", tk.END)
+
+    def __live_translate(self):
+        """Re-translates only the paragraphs that changed since the last live pass."""
+        self.__live_after_id = None
+        src_lang = self.languages[self.source_lang_var.get()]
+        dest_lang = self.languages[self.target_lang_var.get()]
+        text = self.source_text.get("1.0", "end-1c")
+        if src_lang == 'auto':
+            src_lang = self.__detect_source_language(text)
+        edits, pending = self.__live_document.update(text)
+        self.__apply_live_edits(edits)
+
+        # Paragraphs that were edited again or deleted no longer need their old request
+        for token in list(self.__live_futures):
+            if not self.__live_document.is_current(token):
+                self.__live_futures.pop(token).cancel()
+
+        # Unchanged paragraphs are never re-sent; repeated ones come back from the cache
+        for token, paragraph in pending:
+            future = self.engine.submit(paragraph, src_lang, dest_lang)
+            self.__live_futures[token] = future
+            future.add_done_callback(
+                lambda f, token=token: self.dispatcher.post(self.__on_live_paragraph_done, token, f))
+
+    def __on_live_paragraph_done(self, token, future):
+        """Patches one translated paragraph into the output (runs on the main loop)."""
+        if self.__live_futures.get(token) is not future:
+            return
+        del self.__live_futures[token]
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self.instrumentation.error('live_translate', future.exception())
+            return
+        edit = self.__live_document.set_translation(token, future.result())
+        if edit is not None:
+            self.__apply_live_edits([edit])
+
+    def __apply_live_edits(self, edits):
+        """Replaces only the affected character ranges of the translated text."""
+        for start, old_length, new_text in edits:
+            start_index = f"1.0 + {start} chars"
+            if old_length:
+                self.translated_text.delete(start_index, f"1.0 + {start + old_length} chars")
+            if new_text:
+                self.translated_text.insert(start_index, new_text)
+
+    def __on_translation_done(self, future, text, source_lang_name, started):
+        """Handles a finished translation request (runs on the main loop)."""
+        if future is not self.__pending_translation:
+            return  # Superseded by a newer request or cancelled by an edit
+        self.__pending_translation = None
+        if future.cancelled():
+            self.translate_btn.config(state=NORMAL)
+        elif future.exception() is not None:
+            self.__show_translation_error(future.exception())
+        else:
+            self.__show_translation(text, source_lang_name, future.result())
+            # From the click to the translation being shown and saved
+            self.instrumentation.record('translate_text.total', time.perf_counter() - started,
+                                        chars=len(text))
+
+    def __show_translation(self, text, source_lang_name, translated_text):
+        """Displays a finished translation (runs on the main loop)."""
+        with self.instrumentation.span('translate_text.insert', chars=len(translated_text)):
             self.translated_text.delete("1.0", tk.END)
             self.translated_text.insert(tk.END, translated_text)
 
-            # Save to history
-            self.__history.append({
-                'source_text': text,
-                'translated_text': translated_text,
-                'source_lang': self.source_lang_var.get(),
-                'target_lang': self.target_lang_var.get()
-            })
+        # Save to history
+        self.__save_history({
+            'source_text': text,
+            'translated_text': translated_text,
+            'source_lang': source_lang_name,  # The detected language when on Auto-Detect
+            'target_lang': self.target_lang_var.get()
+        })
+
+        # Re-enable the translate button
+        self.translate_btn.config(state=NORMAL)
+
+    def __save_history(self, record):
+        """Stores a translation in the history and the translation memory."""
+        with self.instrumentation.span('history.append'):
+            self.__store.add('history', record)
+            self.__remember_translation(record)
+
+    def __remember_translation(self, record):
+        """Adds a history record to the translation memory (whole documents are skipped)."""
+        if len(record['source_text']) <= DOCUMENT_CHUNK_SIZE:
+            self.__memory.add(record['source_text'], record['translated_text'],
+                              self.languages.get(record['source_lang'], record['source_lang']),
+                              self.languages.get(record['target_lang'], record['target_lang']))
+
+    def __load_translation_memory(self):
+        """Indexes the stored history and favorites (runs on a background thread)."""
+        for table in ('history', 'favorites'):
+            for record in self.__store.iter_records(table):
+                if self.__closing.is_set():
+                    return  # The store is about to close
+                self.__remember_translation(record)
+
+    def __show_suggestions(self, text, src_lang, dest_lang):
+        """Lists close matches from the translation memory under the text areas."""
+        self.__suggestions = []
+        if len(text) <= DOCUMENT_CHUNK_SIZE:
+            self.__suggestions = self.__memory.lookup(text, src_lang, dest_lang)
+        self.suggestion_list.delete(0, tk.END)
+        for score, source, target in self.__suggestions:
+            self.suggestion_list.insert(tk.END, f"{score:.0%}  {source}  →  {target}")
+        if self.__suggestions:
+            self.suggestion_frame.grid()
+        else:
+            self.suggestion_frame.grid_remove()
+
+    def __use_suggestion(self, event):
+        """Copies the double-clicked suggestion into the translated text."""
+        if self.live_var.get():
+            # Live mode patches the output paragraph by paragraph at known offsets;
+            # replacing it wholesale would make the next patch land in the wrong place
+            self.bell()
+            return
+        selection = self.suggestion_list.curselection()
+        if selection:
+            self.translated_text.delete("1.0", tk.END)
+            self.translated_text.insert(tk.END, self.__suggestions[selection[0]][2])
 
-            # Re-enable the translate button
-            self.translate_btn.config(state=NORMAL)
-        except Exception as e:
-            self.translate_btn.config(state=NORMAL)
-            messagebox.showerror("Translation Error", str(e))
+    def __show_translation_error(self, e):
+        """Reports a failed translation (runs on the main loop)."""
+        self.translate_btn.config(state=NORMAL)
+        messagebox.showerror("Translation Error", str(e))
 
-    #  static method and multiple decorators
-    @staticmethod
-    def call_translation_api(text, src_lang, dest_lang):
-        """Calls the translation API."""
-        translator = Translator()
-        result = translator.translate(text, src=src_lang, dest=dest_lang)
-        return result.text
+    def call_translation_api(self, text, src_lang, dest_lang):
+        """Calls the translation API, answering repeated text from the cache."""
+        return self.engine.translate(text, src_lang, dest_lang)
 
     # Polymorphism: Methods to speak different texts (source and translated)
     def speak_source_text(self):
@@ -272,7 +664,7 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         if not text:
             messagebox.showwarning("Text-to-Speech", "No text to speak.")
             return
-        threading.Thread(target=self.__speak_thread, args=(text,)).start()
+        self.__speech.speak(text, self.voice_var.get())
 
     def speak_translated_text(self):
         """Speaks the translated text."""
@@ -280,22 +672,13 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         if not text:
             messagebox.showwarning("Text-to-Speech", "No text to speak.")
             return
-        threading.Thread(target=self.__speak_thread, args=(text,)).start()
-
-    def __speak_thread(self, text):
-        """Thread to handle speaking text."""
-        try:
-            # Set the selected voice
-            selected_voice_name = self.voice_var.get()
-            for voice in self.__voices:
-                if voice.name == selected_voice_name:
-                    self.__engine.setProperty('voice', voice.id)
-                    break
-            # Speak the text
-            self.__engine.say(text)
-            self.__engine.runAndWait()
-        except Exception as e:
-            messagebox.showerror("Text-to-Speech Error", str(e))
+        self.__speech.speak(text, self.voice_var.get())
+
+    def __set_voices(self, names):
+        """Fills the voice selector once the speech engine has listed its voices."""
+        self.voice_cb.config(values=names)
+        if names and not self.voice_var.get():
+            self.voice_var.set(names[0])
 
     def copy_text(self):
         """Copies the translated text to the clipboard."""
@@ -351,7 +734,7 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
             messagebox.showwarning(
                 "Favorites", "No translated text to add to favorites.")
             return
-        self.__favorites.append({
+        self.__store.add('favorites', {
             'source_text': source_text,
             'translated_text': translated_text,
             'source_lang': self.source_lang_var.get(),
@@ -360,64 +743,221 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
         messagebox.showinfo("Favorites", "Translation added to favorites.")
 
     def upload_file(self):
-        """Uploads a text file for translation."""
+        """Uploads a text file for translation. Returns True if a file was loaded."""
         file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")],
                                                title="Open Text File")
         if file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as file:
-                    content = file.read()
+                with self.instrumentation.span('upload_file.read') as span:
+                    with open(file_path, "r", encoding="utf-8") as file:
+                        content = file.read()
+                    span['chars'] = len(content)
+                with self.instrumentation.span('upload_file.insert', chars=len(content)):
                     self.source_text.delete("1.0", tk.END)
                     self.source_text.insert(tk.END, content)
+                return True
             except Exception as e:
                 messagebox.showerror("File Error", str(e))
+        return False
 
     def view_history(self):
         """Displays the translation history."""
-        if not self.__history:
+        if self.__store.is_empty('history'):
             messagebox.showinfo("History", "No history available.")
             return
-        self.__display_records(self.__history, "Translation History")
+        self.__display_records('history', "Translation History")
 
     def clear_history(self):
         """Clears the translation history."""
         if messagebox.askyesno("Clear History", "Are you sure you want to clear the history?"):
-            self.__history.clear()
+            self.__store.clear('history')
             messagebox.showinfo("History", "History cleared.")
 
     def view_favorites(self):
         """Displays the favorites list."""
-        if not self.__favorites:
+        if self.__store.is_empty('favorites'):
             messagebox.showinfo("Favorites", "No favorites available.")
             return
-        self.__display_records(self.__favorites, "Favorites")
+        self.__display_records('favorites', "Favorites")
 
     def clear_favorites(self):
         """Clears the favorites list."""
         if messagebox.askyesno("Clear Favorites", "Are you sure you want to clear the favorites?"):
-            self.__favorites.clear()
+            self.__store.clear('favorites')
             messagebox.showinfo("Favorites", "Favorites cleared.")
 
-    def __display_records(self, records, title):
-        """Displays the records in a table."""
+    def export_history(self):
+        """Exports the translation history to JSONL, CSV or TMX."""
+        self.__export_records('history', "Export History")
+
+    def export_favorites(self):
+        """Exports the favorites to JSONL, CSV or TMX."""
+        self.__export_records('favorites', "Export Favorites")
+
+    def __export_records(self, table, title):
+        """Streams records from the store to a file on a background thread."""
+        file_path = filedialog.asksaveasfilename(defaultextension=".jsonl",
+                                                 filetypes=[
+                                                     ("JSON Lines", "*.jsonl"),
+                                                     ("CSV Files", "*.csv"),
+                                                     ("Translation Memory", "*.tmx")],
+                                                 title=title)
+        if not file_path:
+            return
+        file_format = os.path.splitext(file_path)[1].lstrip('.').lower()
+        if file_format not in EXPORTERS:
+            messagebox.showerror("Export Error", "Please choose a .jsonl, .csv or .tmx file.")
+            return
+
+        def run():
+            try:
+                records = self.__store.iter_records(table)
+                if file_format == 'tmx':
+                    count = export_tmx(records, file_path, lambda name: self.languages.get(name, name))
+                else:
+                    count = EXPORTERS[file_format](records, file_path)
+            except Exception as e:
+                self.dispatcher.post(messagebox.showerror, "Export Error", str(e))
+            else:
+                self.dispatcher.post(messagebox.showinfo, title, f"Exported {count} records.")
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def import_translation_memory(self):
+        """Loads a TMX translation memory into the translation cache."""
+        file_path = filedialog.askopenfilename(filetypes=[("Translation Memory", "*.tmx")],
+                                               title="Import Translation Memory")
+        if not file_path:
+            return
+
+        def run():
+            try:
+                count = import_tmx(file_path, self.engine.cache)
+            except Exception as e:
+                self.dispatcher.post(messagebox.showerror, "Import Error", str(e))
+            else:
+                self.dispatcher.post(messagebox.showinfo, "Import",
+                                     f"Loaded {count} translations into the cache.")
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def __display_records(self, table, title):
+        """Displays the records in a table, loading rows page by page as the user scrolls."""
         window = ttkb.Toplevel(self)
         window.title(title)
         window.geometry("800x400")
         window.resizable(False, False)
 
+        # Search box (full-text search over source and translated text)
+        search_frame = ttkb.Frame(window)
+        search_frame.pack(fill=X, padx=5, pady=5)
+        ttkb.Label(search_frame, text="Search:").pack(side=LEFT)
+        search_var = tk.StringVar()
+        search_entry = ttkb.Entry(search_frame, textvariable=search_var)
+        search_entry.pack(side=LEFT, fill=X, expand=True, padx=5)
+        count_label = ttkb.Label(search_frame, text="")
+        count_label.pack(side=RIGHT)
+
+        table_frame = ttkb.Frame(window)
+        table_frame.pack(fill=BOTH, expand=True)
         columns = ('Source Language', 'Target Language',
                    'Source Text', 'Translated Text')
-        tree = ttkb.Treeview(window, columns=columns, show='headings')
+        tree = ttkb.Treeview(table_frame, columns=columns, show='headings')
         for col in columns:
             tree.heading(col, text=col)
             tree.column(col, width=150 if col !=
                         'Source Text' and col != 'Translated Text' else 250)
+        scrollbar = ttkb.Scrollbar(table_frame, orient=VERTICAL, command=tree.yview)
+        scrollbar.pack(side=RIGHT, fill=Y)
+        tree.pack(side=LEFT, fill=BOTH, expand=True)
+
+        # Paging state: id of the oldest loaded row, and whether more rows exist
+        state = {'last_id': None, 'exhausted': False, 'search': ''}
+
+        def load_page():
+            if state['exhausted']:
+                return
+            records = self.__store.page(table, before_id=state['last_id'],
+                                        limit=RECORDS_PAGE_SIZE, search=state['search'])
+            for item in records:
+                tree.insert('', END, values=(
+                    item['source_lang'], item['target_lang'], item['source_text'], item['translated_text']))
+            if records:
+                state['last_id'] = records[-1]['id']
+            state['exhausted'] = len(records) < RECORDS_PAGE_SIZE
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            # Fetch the next page when the user nears the bottom
+            if float(last) > 0.9:
+                load_page()
+
+        def reload(*args):
+            state.update(last_id=None, exhausted=False, search=search_var.get().strip())
+            tree.delete(*tree.get_children())
+            load_page()
+            count_label.config(text=f"{self.__store.count(table, state['search'])} records")
+
+        tree.configure(yscrollcommand=on_scroll)
+        search_entry.bind('<Return>', reload)
+        reload()
+
+    def show_diagnostics(self):
+        """Shows live latency percentiles, cache and thread/queue stats, and a profiler toggle."""
+        window = ttkb.Toplevel(self)
+        window.title("Diagnostics")
+        window.geometry("700x600")
 
-        tree.pack(fill=BOTH, expand=True)
-
-        for item in records:
-            tree.insert('', END, values=(
-                item['source_lang'], item['target_lang'], item['source_text'], item['translated_text']))
+        columns = ('Span', 'Count', 'p50 (ms)', 'p95 (ms)', 'Max (ms)')
+        tree = ttkb.Treeview(window, columns=columns, show='headings', height=10)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=220 if col == 'Span' else 100, anchor=W if col == 'Span' else E)
+        tree.pack(fill=X, padx=5, pady=5)
+
+        stats_label = ttkb.Label(window, text="", justify=LEFT, font=('TkFixedFont', 10))
+        stats_label.pack(fill=X, padx=5, pady=5)
+
+        # cProfile capture of the main loop; the report is shown below when it stops
+        profile_var = tk.BooleanVar(value=self.instrumentation.profiling)
+        profile_output = tk.Text(window, height=12, wrap=NONE, font=('TkFixedFont', 9))
+
+        def toggle_profiling():
+            if profile_var.get():
+                self.instrumentation.start_profiling()
+            else:
+                report = self.instrumentation.stop_profiling(PROFILE_PATH)
+                profile_output.delete("1.0", tk.END)
+                profile_output.insert(tk.END, f"Saved to {PROFILE_PATH}\n{report}")
+
+        ttkb.Checkbutton(window, text="Profile main thread (cProfile)", variable=profile_var,
+                         command=toggle_profiling, bootstyle="round-toggle").pack(anchor=W, padx=5)
+        profile_output.pack(fill=BOTH, expand=True, padx=5, pady=5)
+
+        def refresh():
+            if not window.winfo_exists():
+                return
+            tree.delete(*tree.get_children())
+            for name, stats in self.instrumentation.summary().items():
+                tree.insert('', END, values=(name, stats['count'], f"{stats['p50'] * 1000:.1f}",
+                                             f"{stats['p95'] * 1000:.1f}", f"{stats['max'] * 1000:.1f}"))
+            lines = []
+            if self.engine.cache is not None:
+                cache = self.engine.cache.stats()
+                lines.append(f"Cache: {cache['hit_rate']:.0%} hit rate ({cache['hits']} hits, "
+                             f"{cache['misses']} misses), {cache['entries']} entries")
+            lines.append(f"Threads: {threading.active_count()} alive, "
+                         f"{self.dispatcher.pending()} UI updates queued, "
+                         f"{self.__speech.pending()} speech requests queued")
+            lines.append("Engine: " + ", ".join(
+                f"{key} {value:.2f}" if isinstance(value, float) else f"{key} {value}"
+                for key, value in self.engine.metrics().items()))
+            for name, error in self.instrumentation.errors().items():
+                lines.append(f"Errors in {name}: {error['count']} (last: {error['last']})")
+            stats_label.config(text="\n".join(lines), wraplength=680)
+            window.after(1000, refresh)
+
+        refresh()
 
     def show_about(self):
         """Displays the 'About' information."""
@@ -426,7 +966,18 @@ class TranslatorApp(ttkb.Window, UtilityMixin):  # Multiple inheritance
 
     def on_closing(self):
         """Handles the closing event."""
-        self.__engine.stop()
+        self.cancel_document_translation()
+        self.__reset_live_mode()
+        self.dispatcher.stop()
+        self.__speech.stop()
+        self.engine.close()
+        # The loader stops at its next record; at most one page read is left to wait for
+        self.__closing.set()
+        self.__memory_loader.join()
+        self.__store.close()
+        if self.instrumentation.profiling:
+            self.instrumentation.stop_profiling(PROFILE_PATH)
+        self.instrumentation.close()
         self.destroy()
 
 
@@ -0,0 +1,76 @@
+import logging
+import queue
+
+logger = logging.getLogger(__name__)
+
+
+class UIDispatcher:
+    """Runs callbacks posted from worker threads on the Tk main loop.
+
+    Tkinter widgets must only be touched from the thread running mainloop(), so
+    workers post() callbacks here instead. The queue is drained with after() every
+    `interval` milliseconds, at most `max_batch` callbacks per drain, so a burst of
+    updates is applied together and Tk redraws once for the whole batch.
+    Callbacks that raise are reported to `instrumentation` as 'ui.callback' errors,
+    or to the logging module without it.
+    """
+
+    def __init__(self, root, interval=30, max_batch=200, instrumentation=None):
+        self.root = root
+        self.interval = interval
+        self.max_batch = max_batch
+        self.instrumentation = instrumentation
+        self.__queue = queue.Queue()
+        self.__after_id = None
+
+    def post(self, callback, *args, key=None):
+        """Queues callback(*args) for the main thread. Safe to call from any thread.
+
+        Callbacks posted with the same key replace each other within one batch,
+        so only the latest value of e.g. a progress update is applied.
+        """
+        self.__queue.put((key, callback, args))
+
+    def pending(self):
+        """Returns the approximate number of queued callbacks."""
+        return self.__queue.qsize()
+
+    def start(self):
+        """Starts draining the queue on the main loop."""
+        if self.__after_id is None:
+            self.__after_id = self.root.after(self.interval, self.__drain)
+
+    def stop(self):
+        """Stops draining; callbacks still queued are discarded."""
+        if self.__after_id is not None:
+            self.root.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def __drain(self):
+        """Applies one batch of queued callbacks (private method)."""
+        batch = []
+        keyed = {}
+        try:
+            while len(batch) < self.max_batch:
+                key, callback, args = self.__queue.get_nowait()
+                if key is not None and key in keyed:
+                    # Superseded update: drop the older entry, keep the position of the newer one
+                    batch[keyed[key]] = None
+                keyed[key] = len(batch)
+                batch.append((callback, args))
+        except queue.Empty:
+            pass
+
+        for entry in batch:
+            if entry is None:
+                continue
+            callback, args = entry
+            try:
+                callback(*args)
+            except Exception as e:
+                if self.instrumentation is None:
+                    logger.exception("UI update failed: %s", e)
+                else:
+                    self.instrumentation.error('ui.callback', e,
+                                               callback=getattr(callback, '__qualname__', repr(callback)))
+        self.__after_id = self.root.after(self.interval, self.__drain)
@@ -0,0 +1,71 @@
+import pygame
+
+# Everything the game loads, preloaded once at startup so nothing is read from disk mid-game
+GAME_IMAGES = (
+    'assets/player.png',
+    'assets/enemy.png',
+    'assets/boss_enemy.png',
+    'assets/sword.png',
+    'assets/health_collectible.png',
+    'assets/life_collectible.png',
+)
+GAME_SOUNDS = (
+    'assets/sounds/jump.wav',
+    'assets/sounds/shoot.wav',
+    'assets/sounds/player_hurt.wav',
+    'assets/sounds/enemy_hit.wav',
+    'assets/sounds/game_over.wav',
+)
+
+
+class AssetManager:
+    """Loads each image and sound once and hands out the shared copy.
+
+    Images are keyed on (path, scale, alpha), so a scaled or semi-transparent
+    variant is also built only once. The surfaces are shared between sprites and
+    must not be drawn on.
+    """
+
+    def __init__(self):
+        self.images = {}
+        self.sounds = {}
+
+    def image(self, path, scale=None, alpha=None):
+        """Returns the image at path, optionally scaled to (width, height) and with a surface alpha."""
+        key = (path, scale, alpha)
+        image = self.images.get(key)
+        if image is None:
+            if scale is None and alpha is None:
+                image = pygame.image.load(path).convert_alpha()
+            else:
+                image = self.image(path)
+                if scale is not None:
+                    image = pygame.transform.scale(image, scale)
+                else:
+                    image = image.copy()
+                if alpha is not None:
+                    image.set_alpha(alpha)
+            self.images[key] = image
+        return image
+
+    def sound(self, path):
+        """Returns the sound at path."""
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = self.sounds[path] = pygame.mixer.Sound(path)
+        return sound
+
+    def preload(self, images=GAME_IMAGES, sounds=GAME_SOUNDS):
+        """Loads the given images and sounds now (needs the display and mixer initialized)."""
+        for path in images:
+            self.image(path)
+        for path in sounds:
+            self.sound(path)
+
+    def clear(self):
+        self.images.clear()
+        self.sounds.clear()
+
+
+# The one shared cache used by every sprite
+assets = AssetManager()
@@ -0,0 +1,105 @@
+"""Per-frame collision cost with and without the spatial grid.
+
+Builds levels with an increasing number of platforms and enemies spread along
+the x axis and times one frame of collision work: the player's platform
+collision (Player.update) and the player/projectile vs enemy checks. The naive
+variant scans every object like the game used to; the grid variant queries
+the level's SpatialHash. Runs without a window.
+
+    python bench_collisions.py
+    python bench_collisions.py --sizes 100 1000 10000 --frames 500
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from spatial_hash import SpatialHash
+
+
+class _Box(pygame.sprite.Sprite):
+    def __init__(self, x, y, width, height):
+        super().__init__()
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+class _AllPlatforms:
+    """Stands in for the grid, returning every platform like the old loop did."""
+
+    def __init__(self, platforms):
+        self.platforms = platforms
+
+    def query(self, rect):
+        return self.platforms
+
+
+def build_world(count, seed=1):
+    rng = random.Random(seed)
+    platforms = [_Box(i * 260, rng.randint(150, 550), rng.randint(200, 400), 20) for i in range(count)]
+    enemies = [_Box(platform.rect.x + 50, platform.rect.top - 50, 40, 50) for platform in platforms]
+    projectiles = [_Box(rng.randint(0, count * 260), rng.randint(0, 600), 30, 10) for _ in range(20)]
+    return platforms, enemies, projectiles
+
+
+def run_frames(player, platforms, enemies, projectiles, frames, use_grid):
+    if use_grid:
+        platform_source = SpatialHash(128)
+        enemy_grid = SpatialHash(128)
+        for platform in platforms:
+            platform_source.insert(platform)
+        for enemy in enemies:
+            enemy_grid.insert(enemy)
+    else:
+        platform_source = _AllPlatforms(platforms)
+        enemy_group = pygame.sprite.Group(enemies)
+
+    start_platform = platforms[0]
+    player.rect.bottom = start_platform.rect.top
+    player.rect.x = start_platform.rect.x + 50
+    player.move_right = True
+    view = pygame.Rect(0, 0, len(platforms) * 260, 600)
+    started = time.perf_counter()
+    for _ in range(frames):
+        player.update(platform_source, start_platform, view)
+        if use_grid:
+            enemy_grid.colliding(player.rect)
+            for projectile in projectiles:
+                enemy_grid.colliding(projectile.rect)
+        else:
+            pygame.sprite.spritecollide(player, enemy_group, False)
+            for projectile in projectiles:
+                pygame.sprite.spritecollide(projectile, enemy_group, False)
+    return (time.perf_counter() - started) / frames
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the collision broadphase.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 5000],
+                        help="number of platforms (and enemies) per level")
+    parser.add_argument('--frames', type=int, default=300, help="frames timed per size")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from player import Player
+
+    print(f"{'objects':>8} {'naive us/frame':>15} {'grid us/frame':>14}")
+    for size in args.sizes:
+        platforms, enemies, projectiles = build_world(size)
+        player = Player(0, 0)
+        naive = run_frames(player, platforms, enemies, projectiles, args.frames, use_grid=False)
+        player = Player(0, 0)
+        grid = run_frames(player, platforms, enemies, projectiles, args.frames, use_grid=True)
+        print(f"{size * 2:>8} {naive * 1e6:>15.1f} {grid * 1e6:>14.1f}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
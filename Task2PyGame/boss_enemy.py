@@ -1,23 +1,31 @@
+import math
 import pygame
+from assets import assets
 
 
 class BossEnemy(pygame.sprite.Sprite):
     def __init__(self, x, y, health):
         super().__init__()
-        self.image = pygame.image.load('assets/boss_enemy.png').convert_alpha()
+        self.image = assets.image('assets/boss_enemy.png')
         self.rect = self.image.get_rect(midbottom=(x, y))
         self.speed = 2
         self.health = health
         self.max_health = health
         self.direction = -1  # Move towards the player
         self.movement_range = 800  # Boss can move within this range
+        self.remainder = 0.0  # Movement below a whole pixel, carried to the next tick
+        self.previous_position = self.rect.topleft  # Position at the previous tick, for drawing
 
         # Load sound
-        self.hit_sound = pygame.mixer.Sound('assets/sounds/enemy_hit.wav')
+        self.hit_sound = assets.sound('assets/sounds/enemy_hit.wav')
 
-    def update(self):
-        # Simple Algoritham to move back and forth
-        self.rect.x += self.speed * self.direction
+    def update(self, step=1.0):
+        # Simple Algoritham to move back and forth; speed is per tick at 90 ticks per second
+        self.previous_position = self.rect.topleft
+        move = self.speed * self.direction * step + self.remainder
+        dx = math.floor(move + 0.5)
+        self.remainder = move - dx
+        self.rect.x += dx
         if self.rect.left <= 0 or self.rect.right >= self.movement_range:
             self.direction *= -1
 
@@ -28,10 +36,12 @@ class BossEnemy(pygame.sprite.Sprite):
             self.kill()
 
     def draw(self, screen, camera):
-        screen.blit(self.image, camera.apply(self))
+        if not camera.is_visible(self.rect, margin=20):
+            return []
+        position = camera.apply(self, self.previous_position)  # Transform once per frame, interpolated
+        sprite_rect = screen.blit(self.image, position)
         # Draw health bar
         health_ratio = self.health / self.max_health
-        pygame.draw.rect(screen, (255, 0, 0), (camera.apply(
-            self).x, camera.apply(self).y - 15, self.rect.width, 10))
-        pygame.draw.rect(screen, (0, 255, 0), (camera.apply(self).x, camera.apply(
-            self).y - 15, self.rect.width * health_ratio, 10))
+        bar_rect = pygame.draw.rect(screen, (255, 0, 0), (position.x, position.y - 15, self.rect.width, 10))
+        pygame.draw.rect(screen, (0, 255, 0), (position.x, position.y - 15, self.rect.width * health_ratio, 10))
+        return [sprite_rect, bar_rect]
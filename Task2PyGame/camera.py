@@ -1,14 +1,51 @@
+import pygame
+
+
 class Camera:
     def __init__(self, player, width, height):
         self.player = player
         self.offset = [0, 0]
+        # Offset at the previous tick and the one used for drawing, between the two
+        self.previous_offset = (0, 0)
+        self.draw_offset = (0, 0)
+        self.alpha = 1.0
         self.width = width
         self.height = height
+        # Part of the world on screen at the latest tick, in world coordinates. The
+        # simulation uses it, so it only ever changes in update(), never per frame
+        self.view = pygame.Rect(0, 0, width, height)
+        # Part of the world on screen in the frame being drawn, for culling
+        self.draw_view = pygame.Rect(0, 0, width, height)
 
     def update(self):
         # Camera follows the player
+        self.previous_offset = tuple(self.offset)
         self.offset[0] = self.player.rect.centerx - self.width // 2
         self.offset[1] = self.player.rect.centery - self.height // 2
+        self.view.topleft = self.offset
+        self.draw_offset = tuple(self.offset)
+        self.draw_view.topleft = self.draw_offset
+
+    def interpolate(self, alpha):
+        # alpha is how far drawing is between the previous tick (0) and the latest one (1)
+        self.alpha = alpha
+        self.draw_offset = (self.lerp(self.previous_offset[0], self.offset[0]),
+                            self.lerp(self.previous_offset[1], self.offset[1]))
+        self.draw_view.topleft = self.draw_offset
+
+    def lerp(self, previous, current):
+        return round(previous + (current - previous) * self.alpha)
+
+    def apply(self, entity, previous_position=None):
+        rect = entity.rect.move(-self.draw_offset[0], -self.draw_offset[1])
+        if previous_position is not None:
+            # Given the entity's position at the previous tick, it is drawn interpolated too
+            rect.x = self.lerp(previous_position[0], entity.rect.x) - self.draw_offset[0]
+            rect.y = self.lerp(previous_position[1], entity.rect.y) - self.draw_offset[1]
+        return rect
 
-    def apply(self, entity):
-        return entity.rect.move(-self.offset[0], -self.offset[1])
+    def is_visible(self, rect, margin=0):
+        # margin leaves room for things drawn around the rect, like health bars
+        if margin:
+            return self.draw_view.inflate(margin * 2, margin * 2).colliderect(rect)
+        return self.draw_view.colliderect(rect)
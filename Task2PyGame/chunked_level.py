@@ -0,0 +1,156 @@
+import random
+from enemy import Enemy
+from collectible import Collectible
+from door import Door
+from level import Level, Platform
+
+# Width of one chunk of the world in pixels
+CHUNK_WIDTH = 800
+# Chunks are loaded while they are within this distance of the player, which
+# covers the camera's view (centred on the player) with room to spare
+LOAD_DISTANCE = 800
+# Loaded chunks are kept until they are this many chunks past the load range,
+# so walking back and forth over a chunk border does not reload it every tick
+UNLOAD_SLACK = 1
+
+# Platform layout: gaps and heights are kept within a normal jump
+PLATFORM_HEIGHT = 20
+PLATFORM_GAP = (40, 120)
+PLATFORM_WIDTH = (80, 300)
+PLATFORM_TOP = (420, 550)
+ENEMIES_PER_CHUNK = (0, 2)
+COLLECTIBLE_CHANCE = 0.25
+
+
+class Chunk:
+    """The platforms, enemies and collectibles generated for one stretch of the world."""
+
+    def __init__(self, index):
+        self.index = index
+        self.platforms = []
+        self.enemies = []
+        self.collectibles = []
+        self.door = None
+
+
+class ChunkedLevel(Level):
+    """A long side-scrolling level generated chunk by chunk around the player.
+
+    Only the chunks near the player are loaded into the level's groups and
+    collision grids, so update and collision cost and memory use stay the same
+    however long the level is. Every chunk is generated from its own seed, so a
+    chunk that was unloaded comes back the same, minus the enemies defeated and
+    collectibles picked up there. length is the number of chunks up to the door;
+    None makes an endless level.
+    """
+
+    def __init__(self, player, level_number, seed=None, length=None):
+        self.length = length
+        self.chunks = {}  # Loaded chunks by index
+        self.cleared = set()  # (chunk index, kind, number) of enemies and collectibles gone for good
+        super().__init__(player, level_number, seed=seed)
+
+    def generate_level(self):
+        # Chunk seeds come from the level's generator, so a level seed fixes the whole world
+        self.chunk_seed = self.random.getrandbits(64)
+
+        # The starting platform stays loaded, so the player can always be put back on it
+        start_platform = Platform(0, self.screen_height - 50, 300, PLATFORM_HEIGHT)
+        self.platforms.add(start_platform)
+        self.platform_grid.insert(start_platform)
+
+        self.guidance_messages.append(('Head right and reach the door!' if self.length
+                                       else 'Head right as far as you can!', 100))
+
+        # Position player on the starting platform
+        self.player.rect.bottom = start_platform.rect.top
+        self.player.rect.x = start_platform.rect.left + 50
+        self.stream()
+
+    def generate_chunk(self, index):
+        """Builds the contents of chunk index; the same index always gives the same chunk."""
+        chunk = Chunk(index)
+        if index < 0 or (self.length is not None and index >= self.length):
+            return chunk  # Nothing before the start or past the door
+        rng = random.Random(f"{self.chunk_seed}:{index}")
+        left = index * CHUNK_WIDTH
+        right = left + CHUNK_WIDTH
+        x = 300 if index == 0 else left  # Chunk 0 starts after the starting platform
+
+        # Platforms from left to right, each within a jump of the one before
+        while True:
+            x += rng.randint(*PLATFORM_GAP)
+            if x + PLATFORM_WIDTH[0] > right:
+                break
+            width = min(rng.randint(*PLATFORM_WIDTH), right - x)
+            chunk.platforms.append(Platform(x, rng.randint(*PLATFORM_TOP), width, PLATFORM_HEIGHT))
+            x += width
+        if not chunk.platforms:
+            return chunk
+
+        for number in range(rng.randint(*ENEMIES_PER_CHUNK)):
+            platform = rng.choice(chunk.platforms)
+            if (index, 'enemy', number) not in self.cleared:
+                chunk.enemies.append(((index, 'enemy', number),
+                                      Enemy(platform.rect.x + 50, platform.rect.top - 50, platform)))
+
+        if rng.random() < COLLECTIBLE_CHANCE:
+            platform = rng.choice(chunk.platforms)
+            if (index, 'collectible', 0) not in self.cleared:
+                chunk.collectibles.append(((index, 'collectible', 0),
+                                           Collectible(platform.rect.centerx, platform.rect.top - 100, 'health')))
+
+        # Door at the end of the last chunk
+        if self.length is not None and index == self.length - 1:
+            last = chunk.platforms[-1]
+            chunk.door = Door(last.rect.right - 100, last.rect.top)
+        return chunk
+
+    def load_chunk(self, index):
+        chunk = self.chunks[index] = self.generate_chunk(index)
+        for platform in chunk.platforms:
+            self.platforms.add(platform)
+            self.platform_grid.insert(platform)
+        for _, enemy in chunk.enemies:
+            self.enemies.add(enemy)
+            self.enemy_grid.insert(enemy)
+        for _, collectible in chunk.collectibles:
+            self.collectibles.add(collectible)
+            self.collectible_grid.insert(collectible)
+        if chunk.door:
+            self.door = chunk.door
+
+    def unload_chunk(self, index):
+        chunk = self.chunks.pop(index)
+        for platform in chunk.platforms:
+            self.platforms.remove(platform)
+            self.platform_grid.remove(platform)
+        # Enemies and collectibles no longer in their group were defeated or picked up
+        for key, enemy in chunk.enemies:
+            if not enemy.alive():
+                self.cleared.add(key)
+            self.enemies.remove(enemy)
+            self.enemy_grid.remove(enemy)
+        for key, collectible in chunk.collectibles:
+            if not collectible.alive():
+                self.cleared.add(key)
+            self.collectibles.remove(collectible)
+            self.collectible_grid.remove(collectible)
+        if chunk.door is self.door:
+            self.door = None
+
+    def stream(self):
+        """Loads the chunks near the player and unloads the ones that fell far behind or ahead."""
+        x = self.player.rect.centerx
+        first = (x - LOAD_DISTANCE) // CHUNK_WIDTH
+        last = (x + LOAD_DISTANCE) // CHUNK_WIDTH
+        for index in list(self.chunks):
+            if index < first - UNLOAD_SLACK or index > last + UNLOAD_SLACK:
+                self.unload_chunk(index)
+        for index in range(first, last + 1):
+            if index not in self.chunks:
+                self.load_chunk(index)
+
+    def update(self, step=1.0):
+        self.stream()
+        super().update(step)
@@ -1,13 +1,14 @@
 import pygame
+from assets import assets
 
 class Collectible(pygame.sprite.Sprite):
     def __init__(self, x, y, type):
         super().__init__()
         self.type = type
         if self.type == 'health':
-            self.image = pygame.image.load('assets/health_collectible.png').convert_alpha()
+            self.image = assets.image('assets/health_collectible.png')
         elif self.type == 'life':
-            self.image = pygame.image.load('assets/life_collectible.png').convert_alpha()
+            self.image = assets.image('assets/life_collectible.png')
         self.rect = self.image.get_rect(center=(x, y))
 
     def apply_effect(self, player):
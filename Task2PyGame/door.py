@@ -9,4 +9,4 @@ class Door(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(midbottom=(x, y))
 
     def draw(self, screen, camera):
-        screen.blit(self.image, camera.apply(self))
+        return screen.blit(self.image, camera.apply(self))
@@ -0,0 +1,49 @@
+import math
+import pygame
+from assets import assets
+
+class Enemy(pygame.sprite.Sprite):
+    def __init__(self, x, y, platform, health=50, speed=1):
+        super().__init__()
+        self.image = assets.image('assets/enemy.png')
+        self.rect = self.image.get_rect(midbottom=(x, y))
+        self.speed = speed
+        self.health = health
+        self.max_health = health
+        self.direction = 1  # 1 for right, -1 for left
+        self.platform = platform  # The platform the enemy is on
+        self.remainder = 0.0  # Movement below a whole pixel, carried to the next tick
+        self.previous_position = self.rect.topleft  # Position at the previous tick, for drawing
+
+        # Load sound
+        self.hit_sound = assets.sound('assets/sounds/enemy_hit.wav')
+
+    def update(self, step=1.0):
+        # Move enemy back and forth on the platform; speed is per tick at 90 ticks per second
+        self.previous_position = self.rect.topleft
+        move = self.speed * self.direction * step + self.remainder
+        dx = math.floor(move + 0.5)
+        self.remainder = move - dx
+        self.rect.x += dx
+
+        # Check boundaries of the platform
+        if self.rect.left < self.platform.rect.left or self.rect.right > self.platform.rect.right:
+            self.direction *= -1  # Change direction
+
+        # Keep enemy on top of the platform
+        self.rect.bottom = self.platform.rect.top
+
+    def take_damage(self, amount):
+        self.health -= amount
+        self.hit_sound.play()
+        if self.health <= 0:
+            self.kill()
+
+    def draw(self, screen, camera):
+        position = camera.apply(self, self.previous_position)  # Transform once per frame, interpolated
+        sprite_rect = screen.blit(self.image, position)
+        # Draw health bar
+        health_ratio = self.health / self.max_health
+        bar_rect = pygame.draw.rect(screen, (255, 0, 0), (position.x, position.y - 10, self.rect.width, 5))
+        pygame.draw.rect(screen, (0, 255, 0), (position.x, position.y - 10, self.rect.width * health_ratio, 5))
+        return [sprite_rect, bar_rect]
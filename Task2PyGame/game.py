@@ -0,0 +1,124 @@
+from player import Player
+from level import Level
+from chunked_level import ChunkedLevel
+from camera import Camera
+from timer import Timer
+
+# Movement, gravity and jump velocities are tuned per tick at this rate; at any
+# other tick rate they are scaled by the tick length, so the game runs at the same speed
+BASE_TICK_RATE = 90
+# Default number of fixed simulation ticks per second
+TICK_RATE = 90
+
+# Control bits for one simulation tick. LEFT/RIGHT are held keys; the others are
+# key presses since the previous tick.
+LEFT = 1
+RIGHT = 2
+JUMP = 4
+SHOOT = 8
+RESET_LEVEL = 16
+
+
+class Game:
+    """The game simulation: player, level, camera and timer, advanced one fixed tick at a time.
+
+    Input comes in as control bits per tick, so the same seed and the same input
+    stream always produce the same game. main.py drives it from the keyboard and
+    draws it; headless.py runs it without a display for benchmarks and replays.
+
+    tick_rate sets how many fixed ticks make up a second of game time.
+
+    With streamed=True each level is a long ChunkedLevel, level_length chunks
+    up to the door (None for endless), loaded around the player as it moves.
+    """
+
+    def __init__(self, seed=None, time_limit=120, screen_width=800, screen_height=600,
+                 streamed=False, level_length=None, tick_rate=TICK_RATE):
+        self.seed = seed
+        self.time_limit = time_limit
+        self.tick_rate = tick_rate
+        self.tick_time = 1.0 / tick_rate
+        self.streamed = streamed
+        self.level_length = level_length
+        self.start_position = (50, screen_height - 150)
+        self.player = Player(*self.start_position)
+        self.camera = Camera(self.player, screen_width, screen_height)
+        self.timer = Timer(time_limit)
+        self.level_number = 1
+        self.level = self.create_level()
+        self.game_over = False
+        self.ticks = 0
+
+    def create_level(self):
+        # Each level has its own random generator; with a game seed every level is reproducible
+        seed = None if self.seed is None else f"{self.seed}:{self.level_number}"
+        if self.streamed:
+            return ChunkedLevel(self.player, self.level_number, seed=seed, length=self.level_length)
+        return Level(self.player, self.level_number, seed=seed)
+
+    def tick(self, controls, dt=None):
+        """Advances the game by one tick of dt seconds (default: tick_time); returns True when the game just ended."""
+        if self.game_over:
+            return False
+        if dt is None:
+            dt = self.tick_time
+        step = dt * BASE_TICK_RATE  # Tick length in the ticks the movement is tuned for
+        player = self.player
+        player.move_left = bool(controls & LEFT)
+        player.move_right = bool(controls & RIGHT)
+        if controls & JUMP:
+            # Pass the starting platform to jump method
+            player.jump(self.level.platforms.sprites()[0])
+        if controls & SHOOT:
+            player.shoot()
+
+        # Update game objects
+        player.update(self.level.platform_grid, self.level.platforms.sprites()[0], self.camera.view, step)
+        self.level.update(step)
+        self.camera.update()
+        self.timer.update(dt)
+        self.ticks += 1
+
+        # Check for level completion
+        if self.level.is_completed:
+            self.level_number += 1  # Move to the next level
+            self.level = self.create_level()
+            self.timer.reset(self.time_limit)
+            player.rect.bottom = self.level.platforms.sprites()[0].rect.top
+            player.rect.x = 50
+
+        # Check for game over conditions
+        if player.lives <= 0 or self.timer.time_left <= 0:
+            self.game_over = True
+            return True
+
+        # Reset level if requested
+        if controls & RESET_LEVEL:
+            self.restart(whole_game=False)
+        return False
+
+    def restart(self, whole_game=True):
+        """Starts over from level 1, or replays the current level."""
+        self.player.reset(*self.start_position)
+        if whole_game:
+            self.level_number = 1
+        self.level = self.create_level()
+        self.timer.reset(self.time_limit)
+        self.game_over = False
+
+    def state(self):
+        """Returns a snapshot of the simulation, used to check that a replay matches."""
+        player = self.player
+        return {
+            'ticks': self.ticks,
+            'level': self.level_number,
+            'player': list(player.rect.topleft),
+            'vel_y': player.vel_y,
+            'health': player.health,
+            'lives': player.lives,
+            'score': player.score,
+            'enemies': sorted([enemy.rect.x, enemy.rect.y, enemy.health] for enemy in self.level.enemies),
+            'projectiles': len(player.projectiles),
+            'time_left': round(self.timer.time_left, 6),
+            'game_over': self.game_over,
+        }
@@ -0,0 +1,147 @@
+"""Runs the game simulation without a window, sound or keyboard.
+
+Uses SDL's dummy video/audio drivers and never draws, so ticks run as fast as
+the CPU allows. Input comes from a seeded scripted player or from a recording;
+together with the per-level seeds this makes every run reproducible.
+
+    python headless.py --seed 7 --ticks 20000                  # benchmark ticks/s
+    python headless.py --seed 7 --ticks 5000 --record run.json  # save the input stream
+    python headless.py --replay run.json                        # replay and verify the end state
+    python headless.py --streamed --level-length 1000           # long levels loaded in chunks
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import zlib
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+
+from assets import assets
+from game import Game, TICK_RATE, LEFT, RIGHT, JUMP, SHOOT
+
+
+def scripted_input(seed):
+    """Yields control bits for a seeded pseudo-player that runs, jumps and shoots."""
+    rng = random.Random(seed)
+    while True:
+        held = rng.choice((0, LEFT, RIGHT, RIGHT))
+        for _ in range(rng.randint(10, 90)):
+            controls = held
+            if rng.random() < 0.03:
+                controls |= JUMP
+            if rng.random() < 0.05:
+                controls |= SHOOT
+            yield controls
+
+
+def encode_inputs(inputs):
+    """Run-length encodes control bits as [[controls, repeat], ...]."""
+    runs = []
+    for controls in inputs:
+        if runs and runs[-1][0] == controls:
+            runs[-1][1] += 1
+        else:
+            runs.append([controls, 1])
+    return runs
+
+
+def decode_inputs(runs):
+    for controls, repeat in runs:
+        for _ in range(repeat):
+            yield controls
+
+
+def run(game, inputs, ticks):
+    """Advances game by up to `ticks` ticks of inputs; restarts it whenever it ends.
+
+    Returns the inputs used, the number of restarts, a checksum of the player's
+    state after every tick (so a replay that diverges anywhere is caught) and
+    the elapsed time.
+    """
+    recorded = []
+    restarts = 0
+    trace = 0
+    player = game.player
+    started = time.perf_counter()
+    for controls in inputs:
+        if len(recorded) >= ticks:
+            break
+        recorded.append(controls)
+        if game.tick(controls):
+            game.restart()
+            restarts += 1
+        trace = zlib.crc32(repr((player.rect.x, player.rect.y, player.vel_y, player.health,
+                                 player.lives, player.score, game.level_number)).encode(), trace)
+    return recorded, restarts, trace, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the game simulation headless.")
+    parser.add_argument('--seed', type=int, default=1, help="seed for the levels and the scripted input")
+    parser.add_argument('--ticks', type=int, default=10000, help="ticks to simulate")
+    parser.add_argument('--time-limit', type=int, default=120, help="level time limit in seconds")
+    parser.add_argument('--tick-rate', type=int, default=TICK_RATE, help="simulation ticks per second")
+    parser.add_argument('--streamed', action='store_true', help="play long levels streamed in chunks")
+    parser.add_argument('--level-length', type=int, help="chunks per streamed level (default: endless)")
+    parser.add_argument('--record', help="save the seed, input stream and end state to this JSON file")
+    parser.add_argument('--replay', help="replay a recording and check the end state matches")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # Needed to convert images; nothing is ever drawn
+    assets.preload()
+
+    if args.replay:
+        with open(args.replay, encoding='utf-8') as f:
+            recording = json.load(f)
+        seed, time_limit = recording['seed'], recording['time_limit']
+        streamed, level_length = recording.get('streamed', False), recording.get('level_length')
+        tick_rate = recording.get('tick_rate', TICK_RATE)
+        inputs = decode_inputs(recording['inputs'])
+        ticks = sum(repeat for _, repeat in recording['inputs'])
+    else:
+        seed, time_limit = args.seed, args.time_limit
+        streamed, level_length = args.streamed, args.level_length
+        tick_rate = args.tick_rate
+        inputs = scripted_input(seed)
+        ticks = args.ticks
+
+    game = Game(seed=seed, time_limit=time_limit, streamed=streamed, level_length=level_length,
+                tick_rate=tick_rate)
+    recorded, restarts, trace, elapsed = run(game, inputs, ticks)
+    state = game.state()
+    state['trace'] = trace
+    pygame.quit()
+
+    print(f"{len(recorded)} ticks in {elapsed:.2f}s: {len(recorded) / elapsed:.0f} ticks/s "
+          f"({len(recorded) / elapsed / tick_rate:.0f}x real time), {restarts} restarts")
+    print(f"end state: level {state['level']}, score {state['score']}, lives {state['lives']}, "
+          f"player at {state['player']}")
+
+    if args.record:
+        with open(args.record, 'w', encoding='utf-8') as f:
+            json.dump({'seed': seed, 'time_limit': time_limit, 'tick_rate': tick_rate,
+                       'streamed': streamed, 'level_length': level_length,
+                       'inputs': encode_inputs(recorded), 'state': state}, f)
+        print(f"recorded to {args.record}")
+
+    if args.replay:
+        expected = recording['state']
+        mismatched = [key for key in expected if expected[key] != state.get(key)]
+        if mismatched:
+            for key in mismatched:
+                print(f"  {key}: recorded {expected[key]}, replayed {state.get(key)}")
+            print("replay diverged")
+            return 1
+        print("replay matches the recording")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
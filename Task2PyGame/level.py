@@ -1,8 +1,19 @@
 import pygame
 import random
+from collections import Counter
 from enemy import Enemy
 from collectible import Collectible
 from door import Door  # Import the Door class
+from spatial_hash import SpatialHash
+from ui import text_cache
+
+# Side of a collision grid cell in pixels, a bit larger than the biggest sprite
+GRID_CELL_SIZE = 128
+# Damage a projectile does to an enemy, and the score for defeating one
+PROJECTILE_DAMAGE = 25
+ENEMY_SCORE = 100
+# Extra height around the view in which enemies are still drawn (for their health bars)
+ENEMY_DRAW_MARGIN = 20
 
 class Platform(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height):
@@ -12,16 +23,23 @@ class Platform(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(topleft=(x, y))
 
 class Level:
-    def __init__(self, player, level_number):
+    def __init__(self, player, level_number, seed=None):
         self.platforms = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.collectibles = pygame.sprite.Group()
         self.door = None  # Add door attribute
         self.player = player
         self.is_completed = False
-        self.font = pygame.font.SysFont('Arial', 24)
+        self.font = text_cache.font('Arial', 24)
         self.level_number = level_number
         self.guidance_messages = []  # List to hold guidance messages
+        # Level layout comes from this generator only, so a seed reproduces the level
+        self.random = random.Random(seed)
+
+        # Collision grids: platforms never move, enemies are re-filed as they walk
+        self.platform_grid = SpatialHash(GRID_CELL_SIZE)
+        self.enemy_grid = SpatialHash(GRID_CELL_SIZE)
+        self.collectible_grid = SpatialHash(GRID_CELL_SIZE)
 
         # Screen dimensions
         self.screen_width = 800
@@ -35,7 +53,7 @@ class Level:
         vertical_gap = 150  # Adjusted for better jump between platforms
 
         # Randomize enemy count (between 3 to 6 enemies)
-        enemy_count = random.randint(3, 6)
+        enemy_count = self.random.randint(3, 6)
 
         # Adjust platform count based on enemy count
         platform_count = enemy_count + 2  # More platforms for more enemies
@@ -43,15 +61,15 @@ class Level:
         # Fixed starting platform (boundary where player always starts)
         start_platform_y = self.screen_height - 50  # 50 pixels above the bottom boundary
         start_platform_width = 300
-        start_platform_x = random.randint(0, self.screen_width - start_platform_width)
+        start_platform_x = self.random.randint(0, self.screen_width - start_platform_width)
         start_platform = Platform(start_platform_x, start_platform_y, start_platform_width, platform_height)
         self.platforms.add(start_platform)
 
         # Randomly generate the remaining platforms
         previous_platform_top = start_platform_y - vertical_gap
         for i in range(platform_count):
-            platform_width = random.randint(200, 400)
-            platform_x = random.randint(0, self.screen_width - platform_width)
+            platform_width = self.random.randint(200, 400)
+            platform_x = self.random.randint(0, self.screen_width - platform_width)
             platform_y = previous_platform_top - vertical_gap
 
             # Ensure player can jump between platforms
@@ -62,14 +80,21 @@ class Level:
         # Generate enemies on platforms (except the starting one)
         platforms = self.platforms.sprites()
         for i in range(enemy_count):
-            platform = random.choice(platforms[1:])  # Avoid the first platform (start platform)
+            platform = self.random.choice(platforms[1:])  # Avoid the first platform (start platform)
             self.enemies.add(Enemy(platform.rect.x + 50, platform.rect.top - 50, platform))
 
         # Door at the end of the level
         self.door = Door(platforms[-1].rect.right - 100, platforms[-1].rect.top - 50)
 
         # Collectibles for health boost
-        self.collectibles.add(Collectible(random.choice(platforms).rect.centerx, platforms[1].rect.top - 100, 'health'))
+        self.collectibles.add(Collectible(self.random.choice(platforms).rect.centerx, platforms[1].rect.top - 100, 'health'))
+
+        for platform in self.platforms:
+            self.platform_grid.insert(platform)
+        for enemy in self.enemies:
+            self.enemy_grid.insert(enemy)
+        for collectible in self.collectibles:
+            self.collectible_grid.insert(collectible)
 
         # Guidance message
         self.guidance_messages.append(('Reach the door to complete the level!', 100))
@@ -78,13 +103,24 @@ class Level:
         self.player.rect.bottom = start_platform.rect.top
         self.player.rect.x = start_platform.rect.left + 50
 
-    def update(self):
-        self.enemies.update()
+    def update(self, step=1.0):
+        # step is the length of this tick in ticks of 90 per second, as in Player.update
+        self.enemies.update(step)
+        for enemy in self.enemies:
+            self.enemy_grid.move(enemy)
+
+        # Projectiles only test the enemies in the grid cells around them; every
+        # enemy hit this frame takes its damage at once
+        for enemy, hits in Counter(self.player.projectiles.collide(self.enemy_grid)).items():
+            enemy.take_damage(PROJECTILE_DAMAGE * hits)
+            if not enemy.alive():
+                self.enemy_grid.remove(enemy)
+                self.player.score += ENEMY_SCORE
 
         # Check for collisions between player and enemies
-        enemy_hits = pygame.sprite.spritecollide(self.player, self.enemies, False)
+        enemy_hits = self.enemy_grid.colliding(self.player.rect)
         for enemy in enemy_hits:
-            self.player.take_damage(5)  # Reduced damage from regular enemies
+            self.player.take_damage(5 * step)  # Reduced damage from regular enemies, per tick of contact
             if self.player.health <= 0:
                 self.player.lose_life()
                 if self.player.lives > 0:
@@ -105,19 +141,26 @@ class Level:
             self.is_completed = True
 
         # Check for collectible pickups
-        collectible_hits = pygame.sprite.spritecollide(self.player, self.collectibles, False)
+        collectible_hits = self.collectible_grid.colliding(self.player.rect)
         for collectible in collectible_hits:
             collectible.apply_effect(self.player)
+            self.collectible_grid.remove(collectible)
 
     def draw(self, screen, camera):
-        for platform in self.platforms:
-            screen.blit(platform.image, camera.apply(platform))
-        for enemy in self.enemies:
-            enemy.draw(screen, camera)
-        for collectible in self.collectibles:
-            screen.blit(collectible.image, camera.apply(collectible))
-        if self.door:
-            self.door.draw(screen, camera)
+        # Only draw what is on screen, found through the collision grids.
+        # Returns the screen rects drawn to, for the dirty-rect renderer.
+        view = camera.draw_view
+        rects = []
+        for platform in self.platform_grid.colliding(view):
+            rects.append(screen.blit(platform.image, camera.apply(platform)))
+        # Enemies draw their health bar just above them
+        for enemy in self.enemy_grid.colliding(view.inflate(0, ENEMY_DRAW_MARGIN * 2)):
+            rects.extend(enemy.draw(screen, camera))
+        for collectible in self.collectible_grid.colliding(view):
+            rects.append(screen.blit(collectible.image, camera.apply(collectible)))
+        if self.door and camera.is_visible(self.door.rect):
+            rects.append(self.door.draw(screen, camera))
+        return rects
 
     def reset_player_position(self):
         platforms = self.platforms.sprites()
@@ -126,9 +169,12 @@ class Level:
         self.player.health = self.player.max_health
 
     def display_guidance(self, screen, camera):
-        """Display guidance messages to the player."""
+        """Display guidance messages to the player; returns the screen rects drawn to."""
+        rects = []
         for message, x_position in self.guidance_messages:
             # Show the guidance message when the player reaches a certain position
             if self.player.rect.x < x_position:
-                text = self.font.render(message, True, (255, 255, 0))
-                screen.blit(text, (self.player.rect.x - camera.offset[0], self.player.rect.y - 40))
+                text = text_cache.render(self.font, message, (255, 255, 0))
+                rects.append(screen.blit(text, (self.player.rect.x - camera.draw_offset[0],
+                                                self.player.rect.y - 40)))
+        return rects
@@ -1,11 +1,10 @@
 import pygame
 import sys
-from player import Player
-from level import Level
-from camera import Camera
+from game import Game, LEFT, RIGHT, JUMP, SHOOT, RESET_LEVEL
 from game_over import GameOverScreen
-from ui import ControlDisplay
-from timer import Timer
+from ui import HUD
+from assets import assets
+from renderer import Renderer
 
 # Initialize Pygame and mixer
 pygame.init()
@@ -17,146 +16,119 @@ SCREEN_HEIGHT = 600
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Side-Scrolling Adventure")
 
+# Load every image and sound up front so spawning sprites never touches the disk
+assets.preload()
+
 # Clock for controlling frame rate
 clock = pygame.time.Clock()
 
-# Create player instance
-player = Player(50, SCREEN_HEIGHT - 150)
-
-# Create camera
-camera = Camera(player, SCREEN_WIDTH, SCREEN_HEIGHT)
+# The simulation advances in fixed ticks (game.tick_rate), independent of how fast frames are drawn
+MAX_FPS = 120  # Frame rate cap for drawing
+# A slow frame runs at most this many catch-up ticks; the rest of the backlog is dropped
+MAX_CATCH_UP_TICKS = 5
+# Frame rate while a static screen is shown; nothing is drawn then, so there is no need to spin
+IDLE_FPS = 15
 
 # Load sounds
 pygame.mixer.music.load('assets/sounds/background_music.mp3')
 pygame.mixer.music.play(-1)  # Loop indefinitely
-game_over_sound = pygame.mixer.Sound('assets/sounds/game_over.wav')
+game_over_sound = assets.sound('assets/sounds/game_over.wav')
 
-# Create control display (Pass SCREEN_WIDTH)
-control_display = ControlDisplay(SCREEN_WIDTH)
+# Create the HUD, including the control display (Pass SCREEN_WIDTH)
+hud = HUD(SCREEN_WIDTH)
 
-# Create level timer
+# Level timer
 level_time_limit = 120  # Increased time limit
-timer = Timer(level_time_limit)
 
-# Initialize the current level number
-current_level_number = 1
+# Long levels streamed in chunks around the player instead of one screen per level
+STREAMED_LEVELS = False
+LEVEL_LENGTH = 12  # Chunks up to the door; None for an endless level
+
+# The simulation (player, level, camera, timer); main only feeds it input and draws it
+game = Game(time_limit=level_time_limit, screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+            streamed=STREAMED_LEVELS, level_length=LEVEL_LENGTH)
 
-# Initialize level before the game loop
-level = Level(player, current_level_number)
+# Updates only the parts of the display that changed
+renderer = Renderer(screen)
+
+def draw_world(surface):
+    # Draws the game over the background; returns the screen rects drawn to
+    camera = game.camera
+    rects = game.level.draw(surface, camera)
+    rects += game.player.draw(surface, camera)
+    # Display HUD and controls
+    rects += hud.draw(surface, game.player, game.timer)
+    # Display guidance
+    rects += game.level.display_guidance(surface, camera)
+    return rects
 
 def main():
-    global current_level_number, level
     running = True
-    game_over = False
     game_over_screen = GameOverScreen(screen)
-    level_reset = False
+    accumulator = 0.0  # Simulation time owed to the fixed-step loop
+    pressed = 0  # Key presses waiting for the next tick
 
     while running:
-        clock.tick(90)  # 60 FPS
+        accumulator += clock.tick(IDLE_FPS if game.game_over else MAX_FPS) / 1000
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Part of the window was uncovered and needs repainting
+                renderer.invalidate()
 
             # Handle player input
-            if not game_over:
+            if not game.game_over:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_UP:
-                        # Pass the starting platform to jump method
-                        player.jump(level.platforms.sprites()[0])  
+                        pressed |= JUMP
+                    if event.key == pygame.K_SPACE:
+                        pressed |= SHOOT
                     if event.key == pygame.K_l:
                         # Reset level
-                        level_reset = True
-                if event.type == pygame.KEYUP:
-                    if event.key == pygame.K_LEFT:
-                        player.move_left = False
-                    if event.key == pygame.K_RIGHT:
-                        player.move_right = False
-                # Continuous movement handling
-                keys = pygame.key.get_pressed()
-                player.move_left = keys[pygame.K_LEFT]
-                player.move_right = keys[pygame.K_RIGHT]
+                        pressed |= RESET_LEVEL
             else:
                 # Handle game over screen input
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
                         # Restart the game
-                        player.reset(50, SCREEN_HEIGHT - 150)
-                        current_level_number = 1
-                        level = Level(player, current_level_number)
-                        timer.reset(level_time_limit)
-                        game_over = False
+                        game.restart(whole_game=True)
                         pygame.mixer.music.play(-1)  # Restart music
                     elif event.key == pygame.K_l:
                         # Restart the current level
-                        player.reset(50, SCREEN_HEIGHT - 150)
-                        level = Level(player, current_level_number)
-                        timer.reset(level_time_limit)
-                        game_over = False
+                        game.restart(whole_game=False)
                         pygame.mixer.music.play(-1)  # Restart music
 
-        if not game_over:
-            # Update game objects
-            player.update(level.platforms, level.platforms.sprites()[0])  # Pass starting platform
-            level.update()
-            camera.update()
-            timer.update()
-
-            # Check for level completion
-            if level.is_completed:
-                current_level_number += 1  # Move to the next level
-                level = Level(player, current_level_number)
-                timer.reset(level_time_limit)
-                player.rect.bottom = level.platforms.sprites()[0].rect.top
-                player.rect.x = 50
-
-            # Check for game over conditions
-            if player.lives <= 0 or timer.time_left <= 0:
-                game_over = True
-                pygame.mixer.music.stop()
-                game_over_sound.play()
-
-            # Reset level if requested
-            if level_reset:
-                player.reset(50, SCREEN_HEIGHT - 150)
-                level = Level(player, current_level_number)
-                timer.reset(level_time_limit)
-                level_reset = False
+        if not game.game_over:
+            # Continuous movement handling
+            keys = pygame.key.get_pressed()
+            held = (LEFT if keys[pygame.K_LEFT] else 0) | (RIGHT if keys[pygame.K_RIGHT] else 0)
+            tick_time = game.tick_time
+            ticks = 0
+            while accumulator >= tick_time and ticks < MAX_CATCH_UP_TICKS and not game.game_over:
+                if game.tick(held | pressed, tick_time):
+                    pygame.mixer.music.stop()
+                    game_over_sound.play()
+                pressed = 0
+                accumulator -= tick_time
+                ticks += 1
+            if ticks == MAX_CATCH_UP_TICKS:
+                # Too far behind: slow the game down rather than spiral into ever longer frames
+                accumulator = min(accumulator, tick_time)
+
+            # Draw between the last two ticks so motion stays smooth at any frame rate
+            game.camera.interpolate(accumulator / game.tick_time)
 
             # Draw everything
-            screen.fill((135, 206, 235))  # Sky blue background
-            level.draw(screen, camera)
-            player.draw(screen, camera)
-
-            # Display HUD
-            display_hud(screen, player, timer)
-            # Display controls
-            control_display.draw(screen)
-            # Display guidance
-            level.display_guidance(screen, camera)
+            renderer.draw_world(game.camera, draw_world)
         else:
-            # Display game over screen
-            game_over_screen.display()
-
-        pygame.display.flip()
+            # Display game over screen; it is only drawn once
+            renderer.draw_static(game_over_screen.background)
+            accumulator = 0.0
+            pressed = 0
 
     pygame.quit()
     sys.exit()
 
-def display_hud(screen, player, timer):
-    # Display health bar
-    pygame.draw.rect(screen, (255, 255, 255), (20, 20, 204, 24))  # White border
-    pygame.draw.rect(screen, (255, 0, 0), (22, 22, 200, 20))
-    pygame.draw.rect(screen, (0, 255, 0), (22, 22, 200 * (player.health / player.max_health), 20))
-    # Display lives
-    font = pygame.font.SysFont('Arial', 24)
-    lives_text = font.render(f'Lives: {player.lives}', True, (255, 255, 255))
-    screen.blit(lives_text, (20, 50))
-    # Display score
-    score_text = font.render(f'Score: {player.score}', True, (255, 255, 255))
-    screen.blit(score_text, (20, 80))
-    # Display timer
-    timer_text = font.render(f'Time Left: {int(timer.time_left)}s', True, (255, 255, 255))
-    screen.blit(timer_text, (SCREEN_WIDTH // 2 - timer_text.get_width() // 2, 20))
-
 if __name__ == '__main__':
     main()
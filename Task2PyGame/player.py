@@ -1,17 +1,19 @@
+import math
 import pygame
-from projectile import Projectile
+from projectile import ProjectilePool
+from assets import assets
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, x, y):
         super().__init__()
         # Load player image
-        self.image = pygame.image.load('assets/player.png').convert_alpha()
+        self.image = assets.image('assets/player.png')
         self.rect = self.image.get_rect(topleft=(x, y))
         self.vel_y = 0
         self.speed = 5
         self.jumping = False
         self.on_ground = False
-        self.projectiles = pygame.sprite.Group()
+        self.projectiles = ProjectilePool()
         self.health = 100
         self.max_health = 100
         self.lives = 3
@@ -19,16 +21,22 @@ class Player(pygame.sprite.Sprite):
         self.move_left = False
         self.move_right = False
         self.current_platform = None  # Track the platform the player is currently on
+        self.previous_position = self.rect.topleft  # Position at the previous tick, for drawing
+        self.remainder = [0.0, 0.0]  # Movement below a whole pixel, carried to the next tick
 
         # Direction the player is facing: 1 for right, -1 for left
         self.direction = 1
 
         # Load sounds
-        self.jump_sound = pygame.mixer.Sound('assets/sounds/jump.wav')
-        self.shoot_sound = pygame.mixer.Sound('assets/sounds/shoot.wav')
-        self.hurt_sound = pygame.mixer.Sound('assets/sounds/player_hurt.wav')
-
-    def update(self, platforms, starting_platform):
+        self.jump_sound = assets.sound('assets/sounds/jump.wav')
+        self.shoot_sound = assets.sound('assets/sounds/shoot.wav')
+        self.hurt_sound = assets.sound('assets/sounds/player_hurt.wav')
+
+    def update(self, platforms, starting_platform, view, step=1.0):
+        # platforms is the level's spatial grid of platforms, view the camera's world rect.
+        # Speeds, gravity and jump velocities are per tick at 90 ticks per second;
+        # step is the length of this tick in those ticks.
+        self.previous_position = self.rect.topleft
         dx = 0
 
         # Movement
@@ -44,18 +52,31 @@ class Player(pygame.sprite.Sprite):
             dx *= 1.5  # Increase horizontal speed in air
 
         # Apply gravity
-        self.vel_y += 0.5
+        self.vel_y += 0.5 * step
         if self.vel_y > 10:
             self.vel_y = 10
-        dy = self.vel_y
 
-        # Collision with platforms
+        # Positions are whole pixels; the fraction left over is carried to the next tick
+        move_x = dx * step + self.remainder[0]
+        move_y = self.vel_y * step + self.remainder[1]
+        dx = math.floor(move_x + 0.5)
+        dy = math.floor(move_y + 0.5)
+        self.remainder = [move_x - dx, move_y - dy]
+
+        # Collision with platforms, only checking the ones near the player's path
         self.on_ground = False
         self.current_platform = None  # Reset current platform
-        for platform in platforms:
-            if platform.rect.colliderect(self.rect.x + dx, self.rect.y, self.rect.width, self.rect.height):
+        nearby = self.rect.inflate(abs(dx) * 2 + 2, abs(dy) * 2 + 2)
+        # Test against the rects the player would actually move to. A falling player
+        # probes at least a pixel down, so one standing still is found on the ground
+        # every tick even when gravity adds less than a pixel.
+        moved_x = self.rect.move(dx, 0)
+        moved_y = self.rect.move(0, max(dy, 1) if self.vel_y > 0 else dy)
+        for platform in platforms.query(nearby):
+            if platform.rect.colliderect(moved_x):
                 dx = 0
-            if platform.rect.colliderect(self.rect.x, self.rect.y + dy, self.rect.width, self.rect.height):
+                self.remainder[0] = 0.0
+            if platform.rect.colliderect(moved_y):
                 if self.vel_y > 0:
                     self.rect.bottom = platform.rect.top
                     self.vel_y = 0
@@ -65,13 +86,14 @@ class Player(pygame.sprite.Sprite):
                     self.rect.top = platform.rect.bottom
                     self.vel_y = 0
                 dy = 0
+                self.remainder[1] = 0.0
 
         # Update position
         self.rect.x += dx
         self.rect.y += dy
 
-        # Update projectiles
-        self.projectiles.update()
+        # Update projectiles, recycling the ones that left the screen
+        self.projectiles.update(view, step)
 
     def jump(self, starting_platform):
         if self.on_ground:
@@ -84,12 +106,9 @@ class Player(pygame.sprite.Sprite):
             self.jump_sound.play()
 
     def shoot(self):
-        # Adjust projectile to use sword image
-        projectile_start_x = self.rect.centerx
-        projectile_start_y = self.rect.centery
-        projectile = Projectile(projectile_start_x, projectile_start_y, direction=self.direction, image_path='assets/sword.png')
-        self.projectiles.add(projectile)
-        self.shoot_sound.play()
+        # Fire a sword from a free slot of the pool; nothing happens if all are in flight
+        if self.projectiles.spawn(self.rect.centerx, self.rect.centery, self.direction):
+            self.shoot_sound.play()
 
     def take_damage(self, amount):
         self.health -= amount
@@ -100,12 +119,16 @@ class Player(pygame.sprite.Sprite):
         self.health = self.max_health
 
     def draw(self, screen, camera):
-        screen.blit(self.image, camera.apply(self))
-        self.projectiles.draw(screen)
+        # Returns the screen rects drawn to
+        rects = [screen.blit(self.image, camera.apply(self, self.previous_position))]
+        rects.extend(self.projectiles.draw(screen, camera))
+        return rects
 
     def reset(self, x, y):
         self.rect.topleft = (x, y)
+        self.previous_position = self.rect.topleft
+        self.remainder = [0.0, 0.0]
         self.health = self.max_health
         self.lives = 3
         self.score = 0
-        self.projectiles.empty()
+        self.projectiles.clear()
@@ -1,16 +1,92 @@
+from array import array
+
 import pygame
+from assets import assets
+
+
+class ProjectilePool:
+    """Fixed number of projectile slots, reused instead of creating a sprite per shot.
+
+    Positions and velocities live in flat arrays indexed by slot; a fired shot
+    takes a free slot and gives it back when it leaves the camera's view or hits
+    something. Nothing is allocated or loaded while shooting.
+    """
+
+    def __init__(self, capacity=64, speed=10, image_path='assets/sword.png'):
+        self.capacity = capacity
+        self.speed = speed
+        # Shared sword image, loaded once
+        self.image = assets.image(image_path)
+        self.width, self.height = self.image.get_size()
+        self.x = array('d', bytes(8 * capacity))
+        self.previous_x = array('d', bytes(8 * capacity))  # x at the previous tick, for drawing
+        self.y = array('d', bytes(8 * capacity))
+        self.vx = array('d', bytes(8 * capacity))
+        self.active = []  # Slots in flight
+        self.free = list(range(capacity - 1, -1, -1))  # Free slots, popped from the end
+        self.__rect = pygame.Rect(0, 0, self.width, self.height)  # Reused for collision tests
+
+    def __len__(self):
+        return len(self.active)
+
+    def spawn(self, x, y, direction=1):
+        """Fires a projectile centred on (x, y); returns False if every slot is in use."""
+        if not self.free:
+            return False
+        slot = self.free.pop()
+        self.x[slot] = self.previous_x[slot] = x - self.width / 2
+        self.y[slot] = y - self.height / 2
+        self.vx[slot] = self.speed * direction
+        self.active.append(slot)
+        return True
+
+    def update(self, view, step=1.0):
+        """Moves every projectile by step ticks and recycles those outside view (a world-space rect)."""
+        x, y, vx, previous_x = self.x, self.y, self.vx, self.previous_x
+        left, right = view.left - self.width, view.right
+        top, bottom = view.top - self.height, view.bottom
+        kept = []
+        for slot in self.active:
+            previous_x[slot] = x[slot]
+            x[slot] += vx[slot] * step
+            if left < x[slot] < right and top < y[slot] < bottom:
+                kept.append(slot)
+            else:
+                self.free.append(slot)
+        self.active = kept
+
+    def collide(self, grid):
+        """Recycles projectiles that hit an object in the grid; returns the objects hit.
+
+        An object hit by several projectiles this frame appears once per hit.
+        """
+        rect = self.__rect
+        hits = []
+        kept = []
+        for slot in self.active:
+            rect.x, rect.y = self.x[slot], self.y[slot]
+            targets = grid.colliding(rect)
+            if targets:
+                hits.append(targets[0])
+                self.free.append(slot)
+            else:
+                kept.append(slot)
+        self.active = kept
+        return hits
+
+    def draw(self, screen, camera):
+        """Draws the projectiles on screen; returns the screen rects drawn to."""
+        offset_x, offset_y = camera.draw_offset
+        view = camera.draw_view
+        rects = []
+        for slot in self.active:
+            x, y = self.x[slot], self.y[slot]
+            if view.left - self.width < x < view.right and view.top - self.height < y < view.bottom:
+                # Drawn between the previous tick and this one, like the camera
+                draw_x = camera.lerp(self.previous_x[slot], x)
+                rects.append(screen.blit(self.image, (draw_x - offset_x, y - offset_y)))
+        return rects
 
-class Projectile(pygame.sprite.Sprite):
-    def __init__(self, x, y, direction=1, image_path='assets/sword.png'):
-        super().__init__()
-        # Load the sword image
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = 10 * direction
-        self.direction = direction
-
-    def update(self):
-        self.rect.x += self.speed
-        # Remove projectile if it goes off-screen
-        if self.rect.right < 0 or self.rect.left > 800:
-            self.kill()
+    def clear(self):
+        self.free.extend(self.active)
+        self.active = []
@@ -0,0 +1,76 @@
+import pygame
+
+# Past this many dirty rects a single full update is cheaper than updating each one
+MAX_DIRTY_RECTS = 100
+
+
+class Renderer:
+    """Sends only the changed parts of the screen to the display.
+
+    Every draw function returns the screen rects it drew to. Each frame the
+    rects drawn last frame are restored from a pre-rendered background, the new
+    frame is drawn, and only the old and new rects are passed to
+    pygame.display.update. A full update happens only when the whole picture
+    moves (the camera scrolled) or after invalidate(). A static screen is not
+    redrawn or updated at all until it changes.
+    """
+
+    def __init__(self, screen, background_color=(135, 206, 235), max_rects=MAX_DIRTY_RECTS):
+        self.screen = screen
+        self.max_rects = max_rects
+        # The sky, rendered once and used to erase the previous frame
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.background.fill(background_color)
+        self.previous_rects = []
+        self.previous_offset = None
+        self.static_surface = None
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def invalidate(self):
+        """Forces a full redraw next frame, e.g. after the window was uncovered."""
+        self.previous_offset = None
+        self.static_surface = None
+
+    def draw_world(self, camera, draw):
+        """Draws a frame of the scrolling world.
+
+        draw(screen) draws everything on top of the background and returns the
+        screen rects it drew to.
+        """
+        screen = self.screen
+        self.static_surface = None
+        if camera.draw_offset != self.previous_offset:
+            # The camera moved, so every pixel is stale
+            screen.blit(self.background, (0, 0))
+            self.previous_rects = draw(screen)
+            self.previous_offset = camera.draw_offset
+            self.full_update()
+            return
+
+        # Erase last frame's sprites, then draw this frame's
+        for rect in self.previous_rects:
+            screen.blit(self.background, rect, rect)
+        rects = draw(screen)
+        dirty = self.previous_rects + rects
+        self.previous_rects = rects
+        if len(dirty) > self.max_rects:
+            self.full_update()
+        else:
+            pygame.display.update(dirty)
+            self.partial_updates += 1
+
+    def draw_static(self, surface):
+        """Shows a full-screen surface, touching the display only when it changes."""
+        if surface is self.static_surface:
+            return
+        self.screen.blit(surface, (0, 0))
+        self.static_surface = surface
+        # The world has to be redrawn from scratch after this
+        self.previous_offset = None
+        self.previous_rects = []
+        self.full_update()
+
+    def full_update(self):
+        pygame.display.update()
+        self.full_updates += 1
@@ -0,0 +1,90 @@
+import itertools
+from collections import defaultdict
+
+
+class SpatialHash:
+    """Uniform grid broadphase: finds the objects whose rect may overlap a query rect.
+
+    Every object is filed under each cell its rect covers, so a query only looks
+    at the handful of cells around the query rect and the cost does not grow
+    with the number of objects in the level. Results come back in insertion
+    order, so collision handling is the same from run to run.
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+        self.__entries = {}  # object -> (insertion order, cell keys)
+        self.__order = itertools.count()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, obj):
+        return obj in self.__entries
+
+    def __iter__(self):
+        return iter(self.__entries)
+
+    def cell_keys(self, rect):
+        """Returns the (column, row) keys of every cell the rect touches."""
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        return [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
+
+    def insert(self, obj, rect=None):
+        """Adds obj under its current rect (obj.rect unless rect is given)."""
+        if obj in self.__entries:
+            self.move(obj, rect)
+            return
+        keys = self.cell_keys(rect or obj.rect)
+        self.__entries[obj] = (next(self.__order), keys)
+        for key in keys:
+            self.cells[key].append(obj)
+
+    def remove(self, obj):
+        """Removes obj; does nothing if it is not in the grid."""
+        entry = self.__entries.pop(obj, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            cell = self.cells[key]
+            cell.remove(obj)
+            if not cell:
+                del self.cells[key]
+
+    def move(self, obj, rect=None):
+        """Re-files obj after it moved; cheap when it stays in the same cells."""
+        entry = self.__entries.get(obj)
+        if entry is None:
+            self.insert(obj, rect)
+            return
+        keys = self.cell_keys(rect or obj.rect)
+        if keys == entry[1]:
+            return
+        order = entry[0]
+        self.remove(obj)
+        self.__entries[obj] = (order, keys)
+        for key in keys:
+            self.cells[key].append(obj)
+
+    def query(self, rect):
+        """Returns the objects filed in the cells the rect touches (a superset of the overlaps)."""
+        cells = self.cells
+        found = {}
+        for key in self.cell_keys(rect):
+            for obj in cells.get(key, ()):
+                found[obj] = None
+        if len(found) < 2:
+            return list(found)
+        entries = self.__entries
+        return sorted(found, key=lambda obj: entries[obj][0])
+
+    def colliding(self, rect):
+        """Returns the objects whose rect actually overlaps the given rect."""
+        return [obj for obj in self.query(rect) if obj.rect.colliderect(rect)]
+
+    def clear(self):
+        self.cells.clear()
+        self.__entries.clear()
@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+# The game's modules live next to this directory; no window or sound card is needed
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+
+@pytest.fixture(scope='session')
+def pygame_display():
+    """Initializes pygame headless and preloads the assets, as headless.py does."""
+    import pygame
+    from assets import assets
+
+    cwd = os.getcwd()
+    os.chdir(GAME_DIR)  # Asset paths are relative to the game directory
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    assets.preload()
+    yield
+    pygame.quit()
+    os.chdir(cwd)
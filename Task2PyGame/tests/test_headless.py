@@ -0,0 +1,56 @@
+import itertools
+import json
+
+import pytest
+
+from game import Game
+from headless import decode_inputs, encode_inputs, run, scripted_input
+
+TICKS = 3000
+
+
+@pytest.fixture(autouse=True)
+def display(pygame_display):
+    pass
+
+
+def play(inputs, ticks=TICKS, **options):
+    game = Game(seed=7, time_limit=30, **options)
+    recorded, restarts, trace, _ = run(game, inputs, ticks)
+    return game, recorded, trace
+
+
+def test_encode_and_decode_inputs_round_trip():
+    inputs = list(itertools.islice(scripted_input(3), 500))
+    runs = encode_inputs(inputs)
+    assert all(repeat > 0 for _, repeat in runs)
+    assert all(a[0] != b[0] for a, b in zip(runs, runs[1:]))
+    assert list(decode_inputs(runs)) == inputs
+
+
+def test_same_seed_and_inputs_give_the_same_game():
+    first, _, first_trace = play(scripted_input(7))
+    second, _, second_trace = play(scripted_input(7))
+    assert first_trace == second_trace
+    assert first.state() == second.state()
+
+    _, _, other_trace = play(scripted_input(8))
+    assert other_trace != first_trace
+
+
+def test_recording_replays_to_the_same_state(tmp_path):
+    game, recorded, trace = play(scripted_input(7))
+    path = tmp_path / 'run.json'
+    path.write_text(json.dumps({'inputs': encode_inputs(recorded), 'state': game.state()}))
+
+    recording = json.loads(path.read_text())
+    replayed, _, replayed_trace = play(decode_inputs(recording['inputs']))
+    assert replayed_trace == trace
+    assert replayed.state() == recording['state']
+
+
+def test_streamed_levels_replay_the_same():
+    first, recorded, trace = play(scripted_input(7), streamed=True, level_length=20)
+    second, _, replayed_trace = play(iter(recorded), streamed=True, level_length=20)
+    assert replayed_trace == trace
+    assert second.state() == first.state()
@@ -0,0 +1,50 @@
+import pygame
+
+from spatial_hash import SpatialHash
+
+
+class Box:
+    def __init__(self, x, y, width=10, height=10):
+        self.rect = pygame.Rect(x, y, width, height)
+
+
+def test_cell_keys_cover_the_rect():
+    grid = SpatialHash(cell_size=100)
+    assert grid.cell_keys(pygame.Rect(0, 0, 100, 100)) == [(0, 0)]
+    assert grid.cell_keys(pygame.Rect(90, 50, 20, 60)) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert grid.cell_keys(pygame.Rect(-10, 0, 5, 5)) == [(-1, 0)]
+
+
+def test_query_finds_nearby_objects_in_insertion_order():
+    grid = SpatialHash(cell_size=100)
+    far = Box(1000, 1000)
+    second = Box(50, 50)
+    first = Box(20, 20)
+    for box in (far, first, second):
+        grid.insert(box)
+    assert len(grid) == 3
+    assert grid.query(pygame.Rect(0, 0, 60, 60)) == [first, second]
+    assert grid.colliding(pygame.Rect(0, 0, 25, 25)) == [first]
+    assert grid.colliding(pygame.Rect(500, 500, 10, 10)) == []
+
+
+def test_move_refiles_and_keeps_order():
+    grid = SpatialHash(cell_size=100)
+    first, second = Box(0, 0), Box(300, 0)
+    grid.insert(first)
+    grid.insert(second)
+    first.rect.x = 310
+    grid.move(first)
+    assert grid.query(pygame.Rect(0, 0, 10, 10)) == []
+    assert grid.query(second.rect) == [first, second]
+
+
+def test_remove_empties_cells():
+    grid = SpatialHash(cell_size=100)
+    box = Box(90, 90, 20, 20)
+    grid.insert(box)
+    grid.remove(box)
+    grid.remove(box)  # Removing twice is harmless
+    assert box not in grid
+    assert not grid.cells
+    assert grid.query(box.rect) == []
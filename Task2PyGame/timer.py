@@ -4,13 +4,19 @@ class Timer:
     def __init__(self, time_limit):
         self.time_limit = time_limit
         self.time_left = time_limit
+        self.elapsed = 0.0
         self.start_ticks = pygame.time.get_ticks()
 
-    def update(self):
-        elapsed_seconds = (pygame.time.get_ticks() - self.start_ticks) / 1000
-        self.time_left = self.time_limit - elapsed_seconds
+    def update(self, dt=None):
+        # With dt the timer counts simulated time (one fixed tick per call), otherwise wall time
+        if dt is None:
+            self.elapsed = (pygame.time.get_ticks() - self.start_ticks) / 1000
+        else:
+            self.elapsed += dt
+        self.time_left = self.time_limit - self.elapsed
 
     def reset(self, time_limit):
         self.time_limit = time_limit
         self.time_left = time_limit
+        self.elapsed = 0.0
         self.start_ticks = pygame.time.get_ticks()
@@ -1,21 +1,60 @@
 import pygame
 import os
+from collections import OrderedDict
+from assets import assets
+
+
+class TextCache:
+    """Rendered text surfaces keyed on (font, text, color), and fonts keyed on (name, size).
+
+    Rendering text is slow compared to blitting it, and HUD strings rarely
+    change, so each distinct string is rendered once and reused until it falls
+    out of the cache. A changed value is simply a new key.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+
+    def font(self, name, size):
+        # name None is pygame's default font; anything else is looked up as a system font
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(None, size) if name is None else pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = font.render(text, True, color)
+            if len(self.surfaces) > self.max_entries:
+                self.surfaces.popitem(last=False)
+        else:
+            self.surfaces.move_to_end(key)
+        return surface
+
+
+# The one shared text cache
+text_cache = TextCache()
+
 
 class ControlDisplay:
     def __init__(self, screen_width):
-        self.font = pygame.font.SysFont('Arial', 20)
+        self.font = text_cache.font('Arial', 20)
         self.controls = []
-        icons = ['left_arrow.png', 'right_arrow.png', 'up_arrow.png']
-        labels = ['Move Left', 'Move Right', 'Jump']
+        icons = ['left_arrow.png', 'right_arrow.png', 'up_arrow.png', 'spacebar.png']
+        labels = ['Move Left', 'Move Right', 'Jump', 'Shoot']
         x, y = screen_width - 200, 20  # Use the passed screen_width
 
         for icon_file, label in zip(icons, labels):
             icon_path = os.path.join('assets', 'icons', icon_file)
             try:
-                image = pygame.image.load(icon_path).convert_alpha()
-                # Resize and make transparent
-                image = pygame.transform.scale(image, (24, 24))
-                image.set_alpha(150)  # Make image more transparent
+                # Resized, more transparent copy, cached like every other image
+                image = assets.image(icon_path, scale=(24, 24), alpha=150)
             except FileNotFoundError:
                 # Create a placeholder surface if the image is missing
                 image = pygame.Surface((24, 24), pygame.SRCALPHA)
@@ -26,8 +65,46 @@ class ControlDisplay:
             self.controls.append({'image': image, 'label': label, 'position': (x, y)})
             y += 40  # Move down for the next control
 
-    def draw(self, screen):
+        # The controls never change, so they are composited once into a single layer
+        self.position = (screen_width - 200, 20)
+        self.layer = pygame.Surface((200, 40 * len(self.controls)), pygame.SRCALPHA)
         for control in self.controls:
-            screen.blit(control['image'], control['position'])
-            label = self.font.render(control['label'], True, (255, 255, 255))
-            screen.blit(label, (control['position'][0] + 30, control['position'][1] + 5))
+            x, y = control['position'][0] - self.position[0], control['position'][1] - self.position[1]
+            self.layer.blit(control['image'], (x, y))
+            self.layer.blit(text_cache.render(self.font, control['label'], (255, 255, 255)), (x + 30, y + 5))
+
+    def draw(self, screen):
+        return screen.blit(self.layer, self.position)
+
+
+class HUD:
+    """Health bar, lives, score and time left, drawn over the game each frame.
+
+    The parts that never change (the health bar frame and the controls) are
+    pre-composited; the text only gets rendered again when its value changes.
+    """
+
+    def __init__(self, screen_width):
+        self.screen_width = screen_width
+        self.font = text_cache.font('Arial', 24)
+        self.controls = ControlDisplay(screen_width)
+        # Health bar frame: white border around the red (missing health) background
+        self.health_frame = pygame.Surface((204, 24))
+        self.health_frame.fill((255, 255, 255))
+        self.health_frame.fill((255, 0, 0), (2, 2, 200, 20))
+
+    def draw(self, screen, player, timer):
+        # Returns the screen rects drawn to
+        # Display health bar
+        rects = [screen.blit(self.health_frame, (20, 20))]
+        pygame.draw.rect(screen, (0, 255, 0), (22, 22, 200 * (player.health / player.max_health), 20))
+        # Display lives
+        rects.append(screen.blit(text_cache.render(self.font, f'Lives: {player.lives}', (255, 255, 255)), (20, 50)))
+        # Display score
+        rects.append(screen.blit(text_cache.render(self.font, f'Score: {player.score}', (255, 255, 255)), (20, 80)))
+        # Display timer
+        timer_text = text_cache.render(self.font, f'Time Left: {int(timer.time_left)}s', (255, 255, 255))
+        rects.append(screen.blit(timer_text, (self.screen_width // 2 - timer_text.get_width() // 2, 20)))
+        # Display controls
+        rects.append(self.controls.draw(screen))
+        return rects